@@ -13,16 +13,8 @@ from dotenv import load_dotenv
 # Silence noisy telemetry logs from dependencies (e.g., ChromaDB posthog errors)
 logging.getLogger("chromadb").setLevel(logging.ERROR)
 
-# Monkeypatch ChromaDB telemetry to disable the failing posthog capture
-try:
-    import chromadb.telemetry.product.posthog
-
-    def disabled_capture(*args, **kwargs):
-        pass
-
-    chromadb.telemetry.product.posthog.Posthog.capture = disabled_capture
-except (ImportError, AttributeError):
-    pass
+# ChromaDB's failing posthog capture is disabled by archon.utils.chroma when
+# chromadb is first imported — not here, so startup doesn't pay that import.
 
 from archon.cli.commands import start_command, resume_command, status_command
 
@@ -122,7 +114,7 @@ def main():
         elif args.command == "status":
             status_command(project_path)
         elif args.command == "voice":
-            from archon.cli.voice_commands import voice_command
+            from archon.cli.voice_commands import voice_command, voice_loop_factory
             import os
 
             activation = getattr(args, "activation", None) or os.getenv(
@@ -132,15 +124,18 @@ def main():
             regional = getattr(args, "regional", False)
             language = getattr(args, "language", "hi-IN")
 
-            asyncio.run(
-                voice_command(
-                    project_path,
-                    activation=activation,
-                    voice_name=voice,
-                    regional=regional,
-                    language=language,
+            # asyncio.Runner (3.11+, the project's floor) lets the loop come
+            # from uvloop without installing a process-wide policy.
+            with asyncio.Runner(loop_factory=voice_loop_factory()) as runner:
+                runner.run(
+                    voice_command(
+                        project_path,
+                        activation=activation,
+                        voice_name=voice,
+                        regional=regional,
+                        language=language,
+                    )
                 )
-            )
 
     except KeyboardInterrupt:
         print("\n👋 Archon session terminated.")
@@ -4,8 +4,12 @@ CLI command for the J.A.R.V.I.S. voice session.
 Registered as `archon voice <path>` via __main__.py.
 """
 
+import asyncio
+import logging
 import os
+import sys
 from pathlib import Path
+from typing import Callable, Optional
 
 from rich.console import Console
 
@@ -13,6 +17,29 @@ from archon.cli.session_config import VoiceActivation
 
 console = Console()
 
+logger = logging.getLogger(__name__)
+
+
+def voice_loop_factory() -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    """
+    Event-loop factory for the voice session.
+
+    Returns uvloop's factory when ARCHON_UVLOOP=1 and uvloop is installed
+    (it is not available on Windows), otherwise None for the default loop.
+    Pass the result to ``asyncio.Runner(loop_factory=...)``.
+    """
+    if os.getenv("ARCHON_UVLOOP", "0") != "1" or sys.platform == "win32":
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        logger.warning(
+            "ARCHON_UVLOOP=1 but uvloop is not installed — using the default asyncio loop. "
+            "Install it with `poetry install -E voice-perf`."
+        )
+        return None
+    return uvloop.new_event_loop
+
 
 async def voice_command(
     project_path: Path,
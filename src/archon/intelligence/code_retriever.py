@@ -1,7 +1,7 @@
 import os
-import chromadb
 from pathlib import Path
 from typing import List, Dict
+from archon.utils.chroma import CHROMA_AVAILABLE, import_chromadb
 from archon.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -17,6 +17,9 @@ class CodeRetriever:
         self.project_path = Path(project_path).resolve()
         self.db_path = self.project_path / ".archon" / "chroma_db"
         self.initialized = False
+        if not CHROMA_AVAILABLE:
+            logger.warning("ChromaDB not installed. Code retrieval disabled.")
+            return
         try:
             self._initialize_client()
         except Exception as e:
@@ -36,6 +39,7 @@ class CodeRetriever:
 
     def _initialize_client(self):
         """Initialize the ChromaDB client and collection."""
+        chromadb = import_chromadb()
         from chromadb.config import Settings
 
         self.client = chromadb.PersistentClient(
@@ -8,15 +8,7 @@ from typing import Dict, List, Optional
 from datetime import datetime
 import hashlib
 
-try:
-    import chromadb
-    from chromadb.config import Settings
-
-    CHROMA_AVAILABLE = True
-except ImportError:
-    chromadb = None
-    CHROMA_AVAILABLE = False
-
+from archon.utils.chroma import CHROMA_AVAILABLE, import_chromadb
 from archon.utils.schemas import Task, TaskResult, AgentMetrics
 from archon.utils.logger import get_logger
 
@@ -39,6 +31,7 @@ class LearningEngine:
         # Vector DB
         self.chroma_client = None
         self.collection = None
+        self._embedder = None
 
     async def initialize(self, archon_dir: Path):
         """
@@ -83,21 +76,69 @@ class LearningEngine:
 
     def _initialize_chroma(self, memory_dir: Path):
         """Initialize ChromaDB for Learning Engine."""
+        chromadb = import_chromadb()
+        from chromadb.config import Settings
+        from chromadb.utils import embedding_functions
+
         self.chroma_client = chromadb.PersistentClient(
             path=str(memory_dir), settings=Settings(anonymized_telemetry=False)
         )
+        # Held (rather than left implicit) so callers can embed text up front
+        self._embedder = embedding_functions.DefaultEmbeddingFunction()
         self.collection = self.chroma_client.get_or_create_collection(
-            name="task_history", metadata={"hnsw:space": "cosine"}
+            name="task_history",
+            metadata={"hnsw:space": "cosine"},
+            embedding_function=self._embedder,
         )
         logger.info("Vector Memory (ChromaDB) initialized")
 
-    async def record_outcome(self, task: Task, result: TaskResult):
+    @staticmethod
+    def context_summary(task: Task, result: TaskResult) -> str:
+        """Text embedded into Vector Memory for a task outcome."""
+        return (
+            f"Task: {task.description}. Agent: {task.agent_type.value}. "
+            f"Success: {result.success}"
+        )
+
+    @property
+    def embedder_id(self) -> Optional[str]:
+        """
+        Identity of the embedding function (class and model name), or None
+        without Vector Memory.  Cached embeddings are only valid for this id.
+        """
+        if self._embedder is None:
+            return None
+        kind = type(self._embedder)
+        model = getattr(self._embedder, "MODEL_NAME", None) or getattr(
+            self._embedder, "model_name", ""
+        )
+        return f"{kind.__module__}.{kind.__qualname__}:{model}"
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed *texts* with the collection's embedding function.
+
+        Lets callers compute (and cache) embeddings for record_outcome() and
+        get_similar_tasks() ahead of time.  Returns [] without Vector Memory.
+        """
+        if self._embedder is None:
+            return []
+        return [[float(x) for x in vec] for vec in self._embedder(texts)]
+
+    async def record_outcome(
+        self,
+        task: Task,
+        result: TaskResult,
+        precomputed_embedding: Optional[List[float]] = None,
+    ):
         """
         Record task outcome for future learning.
 
         Args:
             task: The task that was executed
             result: The result of execution
+            precomputed_embedding: Embedding of context_summary(task, result),
+                if already known; skips embedding it again
         """
         outcome = {
             "task_id": task.task_id,
@@ -111,7 +152,7 @@ class LearningEngine:
             "execution_time_ms": result.execution_time_ms,
             "timestamp": datetime.now().isoformat(),
             # Store a summary for embedding
-            "context_summary": f"Task: {task.description}. Agent: {task.agent_type.value}. Success: {result.success}",
+            "context_summary": self.context_summary(task, result),
         }
 
         self.task_outcomes.append(outcome)
@@ -123,6 +164,9 @@ class LearningEngine:
         # Add to Vector Memory
         if self.collection:
             try:
+                extra = {}
+                if precomputed_embedding is not None:
+                    extra["embeddings"] = [precomputed_embedding]
                 self.collection.add(
                     documents=[outcome["context_summary"]],
                     metadatas=[
@@ -136,17 +180,24 @@ class LearningEngine:
                         }
                     ],
                     ids=[task.task_id],
+                    **extra,
                 )
             except Exception as e:
                 logger.error(f"Failed to add memory to Vector DB: {e}")
 
-    async def get_similar_tasks(self, task_description: str, limit: int = 5) -> List[Dict]:
+    async def get_similar_tasks(
+        self,
+        task_description: str,
+        limit: int = 5,
+        query_embedding: Optional[List[float]] = None,
+    ) -> List[Dict]:
         """
         Find similar tasks from history using Semantic Search.
 
         Args:
             task_description: Description of current task
             limit: Maximum number of similar tasks to return
+            query_embedding: Embedding of task_description, if already known
 
         Returns:
             List of similar task outcomes
@@ -155,7 +206,12 @@ class LearningEngine:
             return []
 
         try:
-            results = self.collection.query(query_texts=[task_description], n_results=limit)
+            if query_embedding is not None:
+                results = self.collection.query(
+                    query_embeddings=[query_embedding], n_results=limit
+                )
+            else:
+                results = self.collection.query(query_texts=[task_description], n_results=limit)
 
             # Retrieve full outcomes based on IDs
             similar_outcomes = []
@@ -32,10 +32,11 @@ class EraserCLITool(BaseTool):
 
     async def validate(self) -> bool:
         """Check if eraser-cli is installed."""
-        res = await self.sandbox.execute("npm list -g eraser-cli", "npm list -g eraser-cli")
+        # Fixed internal probes: run them on the sandbox's persistent shell
+        res = await self.sandbox.exec_shell("npm list -g eraser-cli", "npm list -g eraser-cli")
         if not res.success or "empty" in res.output:
             # Try check execution
-            res = await self.sandbox.execute("eraser", "eraser --version")
+            res = await self.sandbox.exec_shell("eraser", "eraser --version")
             return res.success
         return True
 
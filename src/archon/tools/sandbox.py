@@ -5,8 +5,11 @@ Tool Sandbox - Secure execution environment for external tools.
 import asyncio
 import os
 import shutil
+import signal
 import tempfile
 import time
+import uuid
+import weakref
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 from contextlib import asynccontextmanager
@@ -17,10 +20,27 @@ from archon.utils.schemas import ToolResult
 logger = get_logger(__name__)
 
 
+def _kill_shell(pid: int) -> None:
+    """Finalizer for a ToolSandbox dropped without close(): kill its shell."""
+    try:
+        os.kill(pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+# Stream buffer for the persistent shell: one command's output is read up to
+# its end-of-command marker in a single readuntil()
+_SHELL_STREAM_LIMIT = 16 * 1024 * 1024
+
+
 class ToolSandbox:
     """
     Executes external tools in an isolated environment.
     Enforces resource limits, timeouts, and filesystem restrictions (best effort).
+
+    The exec_shell() worker is stopped by close() or on leaving
+    ``async with ToolSandbox(...)``; a sandbox that is garbage-collected (or
+    still alive at interpreter exit) has its shell killed by a finalizer.
     """
 
     def __init__(self, project_root: str):
@@ -28,6 +48,17 @@ class ToolSandbox:
         self.sandbox_root = self.project_root / ".archon" / "sandbox"
         self.sandbox_root.mkdir(parents=True, exist_ok=True)
 
+        # Long-lived /bin/sh behind exec_shell(), started on first use
+        self._shell: Optional[asyncio.subprocess.Process] = None
+        self._shell_lock: Optional[asyncio.Lock] = None
+        self._shell_finalizer: Optional[weakref.finalize] = None
+
+    async def __aenter__(self) -> "ToolSandbox":
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.close()
+
     async def execute(
         self,
         tool_name: str,
@@ -84,23 +115,7 @@ class ToolSandbox:
                     execution_time_ms=int((time.time() - start_time) * 1000),
                 )
 
-            execution_time = int((time.time() - start_time) * 1000)
-            success = proc.returncode == 0
-
-            output_str = stdout.decode().strip()
-            error_str = stderr.decode().strip()
-
-            if not success:
-                logger.warning(f"Tool '{tool_name}' failed with code {proc.returncode}")
-                logger.debug(f"Stderr: {error_str}")
-
-            return ToolResult(
-                success=success,
-                output=output_str,
-                error=error_str if not success else None,
-                execution_time_ms=execution_time,
-                tool_used=tool_name,
-            )
+            return self._result(tool_name, proc.returncode, stdout, stderr, start_time)
 
         except Exception as e:
             logger.error(f"Sandbox execution error: {e}")
@@ -111,6 +126,147 @@ class ToolSandbox:
                 execution_time_ms=int((time.time() - start_time) * 1000),
             )
 
+    async def exec_shell(
+        self,
+        tool_name: str,
+        command: str,
+        timeout_seconds: int = 300,
+    ) -> ToolResult:
+        """
+        Run a short, trusted command on a persistent shell.
+
+        Same result as execute(), but the command is written to one
+        long-lived /bin/sh instead of spawning a shell per call.  Commands
+        run one at a time, with stdin from /dev/null, and must not change the
+        shell's state (cd, exit, exported variables) — keep execute() for
+        anything untrusted.
+
+        Args:
+            tool_name: Name of the tool (for logging)
+            command: Command string to execute
+            timeout_seconds: Execution timeout; the shell is discarded on expiry
+
+        Returns:
+            ToolResult with stdout, stderr, and metadata
+        """
+        start_time = time.time()
+        if self._shell_lock is None:
+            self._shell_lock = asyncio.Lock()
+
+        async with self._shell_lock:
+            try:
+                logger.info(f"Executing tool '{tool_name}' on shell: {command}")
+                shell = await self._get_shell()
+
+                # Each stream ends with a per-call marker (on its own line, so
+                # output without a trailing newline can't hide it); stdout's
+                # also carries the exit status.
+                marker = f"__ARCHON_DONE_{uuid.uuid4().hex}__"
+                shell.stdin.write(
+                    f"{{ {command}\n}} </dev/null\n"
+                    f"printf '\\n%s %d\\n' {marker} $?\n"
+                    f"printf '\\n%s\\n' {marker} >&2\n".encode()
+                )
+                await shell.stdin.drain()
+
+                async def _read_stdout():
+                    out = await shell.stdout.readuntil(f"{marker} ".encode())
+                    code = int(await shell.stdout.readline())
+                    return out, code
+
+                (stdout, returncode), stderr = await asyncio.wait_for(
+                    asyncio.gather(
+                        _read_stdout(),
+                        shell.stderr.readuntil(f"{marker}\n".encode()),
+                    ),
+                    timeout=timeout_seconds,
+                )
+            except asyncio.TimeoutError:
+                await self.close()
+                return ToolResult(
+                    success=False,
+                    output="",
+                    error=f"Execution timed out after {timeout_seconds}s",
+                    execution_time_ms=int((time.time() - start_time) * 1000),
+                )
+            except Exception as e:
+                # The shell exited or its streams are out of step: start over
+                await self.close()
+                logger.error(f"Sandbox shell error: {e}")
+                return ToolResult(
+                    success=False,
+                    output="",
+                    error=str(e),
+                    execution_time_ms=int((time.time() - start_time) * 1000),
+                )
+
+        return self._result(
+            tool_name,
+            returncode,
+            stdout[: -len(marker) - 1],
+            stderr[: -len(marker) - 1],
+            start_time,
+        )
+
+    async def close(self) -> None:
+        """Stop the exec_shell() worker, if one is running."""
+        shell, self._shell = self._shell, None
+        if self._shell_finalizer is not None:
+            self._shell_finalizer.detach()
+            self._shell_finalizer = None
+        if shell is None or shell.returncode is not None:
+            return
+        try:
+            shell.kill()
+        except ProcessLookupError:
+            pass
+        await shell.wait()
+
+    async def _get_shell(self) -> asyncio.subprocess.Process:
+        """Return the running exec_shell() worker, starting it if needed."""
+        if self._shell is None or self._shell.returncode is not None:
+            self._shell = await asyncio.create_subprocess_exec(
+                "/bin/sh",
+                "-s",
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=str(self.project_root),
+                env=os.environ.copy(),
+                limit=_SHELL_STREAM_LIMIT,
+            )
+            if self._shell_finalizer is not None:
+                self._shell_finalizer.detach()
+            self._shell_finalizer = weakref.finalize(self, _kill_shell, self._shell.pid)
+        return self._shell
+
+    @staticmethod
+    def _result(
+        tool_name: str,
+        returncode: Optional[int],
+        stdout: bytes,
+        stderr: bytes,
+        start_time: float,
+    ) -> ToolResult:
+        """Build the ToolResult for a finished command."""
+        execution_time = int((time.time() - start_time) * 1000)
+        success = returncode == 0
+
+        output_str = stdout.decode().strip()
+        error_str = stderr.decode().strip()
+
+        if not success:
+            logger.warning(f"Tool '{tool_name}' failed with code {returncode}")
+            logger.debug(f"Stderr: {error_str}")
+
+        return ToolResult(
+            success=success,
+            output=output_str,
+            error=error_str if not success else None,
+            execution_time_ms=execution_time,
+            tool_used=tool_name,
+        )
+
     @asynccontextmanager
     async def isolated_environment(self):
         """Context manager for temporary isolation (placeholder for Docker/VM)."""
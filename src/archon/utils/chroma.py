@@ -0,0 +1,39 @@
+"""
+ChromaDB loading shared by the Vector Memory users.
+
+chromadb (and the embedding stack behind it) takes seconds to import, so
+modules probe for it with CHROMA_AVAILABLE and call import_chromadb() only
+when they actually open a client.
+"""
+
+import importlib.util
+from types import ModuleType
+
+# Probe only — does not import the package
+CHROMA_AVAILABLE = importlib.util.find_spec("chromadb") is not None
+
+_telemetry_patched = False
+
+
+def import_chromadb() -> ModuleType:
+    """
+    Import and return chromadb, with its posthog telemetry capture disabled.
+
+    Raises ImportError if chromadb is not installed.
+    """
+    global _telemetry_patched
+    import chromadb
+
+    if not _telemetry_patched:
+        _telemetry_patched = True
+        # The posthog capture call fails noisily on some installs
+        try:
+            import chromadb.telemetry.product.posthog
+
+            def disabled_capture(*args, **kwargs):
+                pass
+
+            chromadb.telemetry.product.posthog.Posthog.capture = disabled_capture
+        except (ImportError, AttributeError):
+            pass
+    return chromadb
@@ -31,6 +31,7 @@ without polling.
 import asyncio
 import logging
 import os
+from collections import deque
 from enum import Enum, auto
 from typing import Optional
 
@@ -78,6 +79,9 @@ class _BaseActivator:
         """Block until the next activation event is available."""
         return await self._events.get()
 
+    def push_audio(self, pcm_bytes: bytes) -> None:
+        """Feed a raw mic chunk.  Only audio-driven modes use it; no-op here."""
+
     def _emit(self, event: ActivationEvent) -> None:
         """Push an event (thread-safe via call_soon_threadsafe if needed)."""
         self._events.put_nowait(event)
@@ -205,6 +209,25 @@ class WakeWordActivator(_BaseActivator):
     # Silence gate: end turn after this many consecutive quiet frames
     SILENCE_FRAMES_TO_END: int = 15  # 15 × 100ms = 1.5 s of silence
     ENERGY_THRESHOLD: float = 0.02  # RMS threshold for silence detection during active turn
+    AUDIO_RING_CHUNKS: int = 50  # 5 s of 100 ms chunks; older audio is dropped if inference lags
+    WAKE_BATCH_CHUNKS: int = 4  # max backlogged chunks scored in one predict() call
+
+    # Per-chunk state read by _monitor_loop lives in slots rather than the
+    # instance dict.  The base class keeps a __dict__, so the class-level
+    # tunables above can still be overridden per instance.
+    __slots__ = (
+        "_listening_for_wake",
+        "_active_turn",
+        "_silence_streak",
+        "_monitor_task",
+        "_audio_ring",
+        "_audio_ready",
+        "_audio_waiting",
+        "_oww_model",
+        "_model_key",
+        "_custom_model_path",
+        "_threshold",
+    )
 
     def __init__(self) -> None:
         super().__init__()
@@ -213,8 +236,13 @@ class WakeWordActivator(_BaseActivator):
         self._silence_streak: int = 0
         self._monitor_task: Optional[asyncio.Task] = None  # type: ignore[type-arg]
 
-        # Audio queue — receives raw PCM bytes from VoiceSession
-        self._audio_queue: asyncio.Queue[bytes] = asyncio.Queue()
+        # Audio ring — receives raw PCM bytes from VoiceSession.  One producer
+        # (push_audio) and one consumer (_monitor_loop), both on the event
+        # loop, so a bare deque suffices; _audio_ready is only set while the
+        # monitor is actually parked on it.
+        self._audio_ring: deque[bytes] = deque(maxlen=self.AUDIO_RING_CHUNKS)
+        self._audio_ready = asyncio.Event()
+        self._audio_waiting: bool = False
 
         # openwakeword model (loaded in start())
         self._oww_model: Optional[object] = None
@@ -249,7 +277,10 @@ class WakeWordActivator(_BaseActivator):
         Args:
             pcm_bytes: Raw LINEAR16 mono PCM at 16 kHz (int16 bytes).
         """
-        self._audio_queue.put_nowait(pcm_bytes)
+        self._audio_ring.append(pcm_bytes)
+        if self._audio_waiting:
+            self._audio_waiting = False
+            self._audio_ready.set()
 
     # ── Model loading ─────────────────────────────────────────────────────
 
@@ -301,54 +332,97 @@ class WakeWordActivator(_BaseActivator):
         Consume raw PCM audio and fire activation events.
 
         In WAITING_FOR_WAKE state: runs openwakeword inference on each chunk.
+        If inference has fallen behind, up to WAKE_BATCH_CHUNKS queued chunks
+        are scored in one predict() call (openwakeword accepts any length and
+        reports the peak frame score), amortising its per-call overhead; if
+        such a batch wakes, its later chunks are replayed into the new turn.
         In ACTIVE_TURN state: monitors RMS for silence to end the turn.
         """
+        ring = self._audio_ring
         while True:
-            try:
-                pcm_bytes = await self._audio_queue.get()
-            except asyncio.CancelledError:
-                break
+            while not ring:
+                self._audio_ready.clear()
+                self._audio_waiting = True
+                try:
+                    await self._audio_ready.wait()
+                except asyncio.CancelledError:
+                    return
+            if not self._listening_for_wake:
+                self._track_turn_silence(ring)
+                continue
+
+            # ── Wake-word detection ──────────────────────────────────────
+            if len(ring) > 1:
+                chunks = [ring.popleft() for _ in range(min(len(ring), self.WAKE_BATCH_CHUNKS))]
+                pcm_bytes = b"".join(chunks)
+            else:
+                chunks = None
+                pcm_bytes = ring.popleft()
 
             # Convert PCM bytes to int16 numpy array (openwakeword native format)
             audio_i16 = np.frombuffer(pcm_bytes, dtype=np.int16)
+            prediction = self._oww_model.predict(audio_i16)  # type: ignore[union-attr]
+            score = prediction.get(self._model_key, 0.0)
+
+            if score >= self._threshold:
+                logger.info(
+                    "Wake-word detected! (model=%s, score=%.3f, threshold=%.3f)",
+                    self._model_key,
+                    score,
+                    self._threshold,
+                )
+                self._listening_for_wake = False
+                self._active_turn = True
+                self._silence_streak = 0
+                # Reset model state so it doesn't re-trigger on residual audio
+                self._oww_model.reset()  # type: ignore[union-attr]
+                if chunks is not None:
+                    # The batch only reports its peak, so the chunk that hit is
+                    # unknown: hand everything after the first back to the new
+                    # turn rather than drop audio spoken right after the wake.
+                    ring.extendleft(reversed(chunks[1:]))
+                self._emit(ActivationEvent.LISTENING_START)
+
+    def _track_turn_silence(self, ring: "deque[bytes]") -> None:
+        """
+        Active turn: count quiet chunks and end the turn after enough of them.
 
-            if self._listening_for_wake:
-                # ── Wake-word detection ──────────────────────────────────
-                prediction = self._oww_model.predict(audio_i16)  # type: ignore[union-attr]
-                score = prediction.get(self._model_key, 0.0)
-
-                if score >= self._threshold:
-                    logger.info(
-                        "Wake-word detected! (model=%s, score=%.3f, threshold=%.3f)",
-                        self._model_key,
-                        score,
-                        self._threshold,
-                    )
-                    self._listening_for_wake = False
-                    self._active_turn = True
-                    self._silence_streak = 0
-                    # Reset model state so it doesn't re-trigger on residual audio
-                    self._oww_model.reset()  # type: ignore[union-attr]
-                    self._emit(ActivationEvent.LISTENING_START)
-
-            else:
-                # ── Active turn: monitor for silence ─────────────────────
-                audio_f32 = audio_i16.astype(np.float32) / 32768.0
-                rms = float(np.sqrt(np.mean(audio_f32**2)))
-
-                if rms < self.ENERGY_THRESHOLD:
-                    self._silence_streak += 1
-                    if self._silence_streak >= self.SILENCE_FRAMES_TO_END:
-                        logger.debug(
-                            "Wake-word turn ended by silence (%d frames)",
-                            self._silence_streak,
-                        )
-                        self._active_turn = False
-                        self._listening_for_wake = True
-                        self._silence_streak = 0
-                        self._emit(ActivationEvent.LISTENING_END)
-                else:
-                    self._silence_streak = 0
+        Every queued chunk of the same size is classified in one vectorised
+        pass (exact int64 sums of squares straight off the int16 samples), then
+        the streak is advanced chunk by chunk.  Chunks are only consumed up to
+        the one that ends the turn, so whatever follows goes to wake-word
+        detection as before.
+        """
+        size = len(ring[0])
+        count = 1
+        while count < len(ring) and len(ring[count]) == size:
+            count += 1
+        if count == 1:
+            frames = np.frombuffer(ring[0], dtype=np.int16)[None, :]
+        else:
+            joined = b"".join([ring[i] for i in range(count)])
+            frames = np.frombuffer(joined, dtype=np.int16).reshape(count, -1)
+
+        sumsq = np.einsum("ij,ij->i", frames, frames, dtype=np.int64)
+        rms = np.sqrt(sumsq / max(frames.shape[1], 1)) / 32768.0
+        quiet = (rms < self.ENERGY_THRESHOLD).tolist()
+
+        for is_quiet in quiet:
+            ring.popleft()
+            if not is_quiet:
+                self._silence_streak = 0
+                continue
+            self._silence_streak += 1
+            if self._silence_streak >= self.SILENCE_FRAMES_TO_END:
+                logger.debug(
+                    "Wake-word turn ended by silence (%d frames)",
+                    self._silence_streak,
+                )
+                self._active_turn = False
+                self._listening_for_wake = True
+                self._silence_streak = 0
+                self._emit(ActivationEvent.LISTENING_END)
+                return
 
 
 # ── Factory ───────────────────────────────────────────────────────────────────
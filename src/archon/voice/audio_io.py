@@ -21,7 +21,8 @@ import asyncio
 import os
 import queue
 import struct
-from typing import AsyncIterator
+from collections import deque
+from typing import AsyncIterator, Optional
 
 import numpy as np
 
@@ -30,6 +31,14 @@ try:
 except ImportError:  # pragma: no cover
     sd = None  # type: ignore[assignment]
 
+# Optional SIMD RMS kernel (numpy-rms).  Only its float32 path is vectorised —
+# int16 input falls back to a pure-NumPy routine that overflows — so callers
+# must hand it float32 samples.
+try:
+    from numpy_rms import rms as _simd_rms
+except ImportError:  # pragma: no cover
+    _simd_rms = None
+
 
 # ── Configuration ─────────────────────────────────────────────────────────────
 
@@ -44,6 +53,9 @@ SPEAKER_CHUNK_FRAMES: int = int(SPEAKER_SAMPLE_RATE * CHUNK_DURATION_S)
 DTYPE = np.int16
 BYTES_PER_SAMPLE = 2  # int16 = 2 bytes
 
+# Mic backlog bound: beyond this many unread chunks (5 s) the oldest are dropped
+MIC_RING_CHUNKS: int = 50
+
 
 # ── Custom exceptions ─────────────────────────────────────────────────────────
 
@@ -81,20 +93,37 @@ def compute_rms(pcm_bytes: bytes) -> float:
     samples = np.frombuffer(pcm_bytes, dtype=np.int16).astype(np.float32)
     if samples.size == 0:
         return 0.0
-    rms = float(np.sqrt(np.mean(samples**2)))
+    if _simd_rms is not None:
+        rms = float(_simd_rms(samples)[0])
+    else:
+        rms = float(np.sqrt(np.mean(samples**2)))
     return min(rms / 32768.0, 1.0)
 
 
-def pcm_bytes_to_np(pcm_bytes: bytes) -> np.ndarray:
-    """Convert raw PCM bytes to a float32 numpy array in [-1, 1]."""
-    arr = np.frombuffer(pcm_bytes, dtype=np.int16).astype(np.float32)
-    return arr / 32768.0
+def pcm_bytes_to_np(pcm_bytes: bytes, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Convert raw PCM bytes to a float32 numpy array in [-1, 1].
 
+    Decodes and scales in one pass over a zero-copy int16 view, into *out*
+    (a reusable float32 buffer of the right length) or a new array.
+    """
+    samples = np.frombuffer(pcm_bytes, dtype=np.int16)
+    if out is None:
+        out = np.empty(samples.size, dtype=np.float32)
+    return np.divide(samples, np.float32(32768.0), out=out)
 
-def np_to_pcm_bytes(arr: np.ndarray) -> bytes:
-    """Convert a float32 numpy array in [-1, 1] back to int16 PCM bytes."""
-    arr = np.clip(arr, -1.0, 1.0)
-    return (arr * 32767).astype(np.int16).tobytes()
+
+def np_to_pcm_bytes(arr: np.ndarray, out: Optional[np.ndarray] = None) -> bytes:
+    """
+    Convert a float32 numpy array in [-1, 1] back to int16 PCM bytes.
+
+    Scales straight into *out* (a reusable int16 buffer of the right length)
+    or a new array, truncating as ``astype(np.int16)`` does.
+    """
+    if out is None:
+        out = np.empty(arr.shape[0], dtype=np.int16)
+    np.multiply(np.clip(arr, -1.0, 1.0), 32767, out=out, casting="unsafe")
+    return out.tobytes()
 
 
 # ── MicCapture ────────────────────────────────────────────────────────────────
@@ -116,15 +145,25 @@ class MicCapture:
     def __init__(self, sample_rate: int = MIC_SAMPLE_RATE) -> None:
         _check_sounddevice()
         self.sample_rate = sample_rate
-        self._q: asyncio.Queue[bytes | None] = asyncio.Queue()
-        self._stream: "sd.InputStream | None" = None
+        self._stream: "sd.RawInputStream | None" = None
         self._loop: asyncio.AbstractEventLoop | None = None
 
+        # Single-producer (PortAudio thread) / single-consumer (event loop)
+        # ring.  deque.append/popleft are atomic under the GIL, so the only
+        # cross-thread call is the wake-up, made only while the consumer is
+        # actually parked on _ready.
+        self._ring: deque[bytes] = deque(maxlen=MIC_RING_CHUNKS)
+        self._ready = asyncio.Event()
+        self._waiting: bool = False
+        self._closed: bool = False
+
     # ── Context manager ────────────────────────────────────────────────────
 
     async def __aenter__(self) -> "MicCapture":
         self._loop = asyncio.get_running_loop()
-        self._stream = sd.InputStream(
+        # RawInputStream hands the callback a plain buffer rather than
+        # wrapping every block in a new NumPy array.
+        self._stream = sd.RawInputStream(
             samplerate=self.sample_rate,
             channels=1,
             dtype="int16",
@@ -145,13 +184,14 @@ class MicCapture:
             self._stream.stop()
             self._stream.close()
         # Signal the async iterator to stop
-        await self._q.put(None)
+        self._closed = True
+        self._ready.set()
 
     # ── sounddevice callback (runs in a C thread) ──────────────────────────
 
     def _callback(
         self,
-        indata: np.ndarray,
+        indata: "memoryview | bytes",
         frames: int,
         time: object,
         status: object,
@@ -159,9 +199,13 @@ class MicCapture:
         """Called by sounddevice for each audio block. Thread-safe."""
         if self._loop is None:
             return
-        pcm = indata.copy().tobytes()
-        # Schedule a put on the event-loop thread
-        self._loop.call_soon_threadsafe(self._q.put_nowait, pcm)
+        # One copy out of PortAudio's buffer, which is only valid during the
+        # callback.  Chunks are kept as bytes (not views into a shared ring)
+        # because consumers such as the wake-word queue hold on to them.
+        self._ring.append(bytes(indata))
+        if self._waiting:
+            self._waiting = False
+            self._loop.call_soon_threadsafe(self._ready.set)
 
     # ── Async iterator ─────────────────────────────────────────────────────
 
@@ -169,10 +213,26 @@ class MicCapture:
         return self
 
     async def __anext__(self) -> bytes:
-        chunk = await self._q.get()
-        if chunk is None:
-            raise StopAsyncIteration
-        return chunk
+        ring = self._ring
+        while not ring:
+            if self._closed:
+                raise StopAsyncIteration
+            self._ready.clear()
+            self._waiting = True
+            if ring:  # a chunk landed before the producer saw _waiting
+                self._waiting = False
+                break
+            await self._ready.wait()
+        return ring.popleft()
+
+    def drain_nowait(self) -> list[bytes]:
+        """
+        Return every chunk already captured, without waiting.
+
+        Lets a consumer that fell behind process the backlog as one batch.
+        """
+        ring = self._ring
+        return [ring.popleft() for _ in range(len(ring))]
 
 
 # ── SpeakerPlayback ───────────────────────────────────────────────────────────
@@ -19,6 +19,11 @@ Pipeline stages (applied in order):
 All stages are stateful — filter memory and gain state carry across chunk
 boundaries so audio is continuous with no clicks or pops at seams.
 
+The high-pass recurrence is inherently per-sample; when numba is installed
+it runs as a compiled kernel, otherwise as the plain Python loop.  With numba,
+process() goes further and runs HPF + gate + AGC as one fused kernel that
+makes two passes over the chunk instead of one per stage.
+
 Usage::
 
     preprocessor = AudioPreprocessor()
@@ -30,11 +35,10 @@ Usage::
 import logging
 import math
 import os
-from typing import Optional, Tuple
+from typing import Callable, Optional, Tuple, Union
 
 import numpy as np
 
-from archon.voice.audio_io import pcm_bytes_to_np, np_to_pcm_bytes
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +48,128 @@ _HPF_CUTOFF_HZ = float(os.getenv("ARCHON_HPF_CUTOFF", "80"))
 _NOISE_GATE_THRESHOLD = float(os.getenv("ARCHON_NOISE_GATE_THRESHOLD", "0.008"))
 _AGC_TARGET_RMS = float(os.getenv("ARCHON_AGC_TARGET", "0.15"))
 
+# High-pass state magnitude below which the filter counts as settled for the
+# digital-silence fast path in process() (one int16 LSB is ~3e-5)
+_HPF_SETTLED = 1e-9
+
+
+# ── High-pass kernel ──────────────────────────────────────────────────────────
+
+
+def _biquad_hpf(
+    audio: np.ndarray,
+    out: np.ndarray,
+    b0: float,
+    b1: float,
+    b2: float,
+    a1: float,
+    a2: float,
+    z1: float,
+    z2: float,
+) -> Tuple[float, float]:
+    """
+    Biquad recurrence (Direct Form II transposed) over *audio* into *out*,
+    written for ``numba.njit``.
+
+    *out* may be *audio* itself.  Returns the updated (z1, z2) state.
+    """
+    for i in range(audio.shape[0]):
+        x = float(audio[i])
+        y = b0 * x + z1
+        z1 = b1 * x - a1 * y + z2
+        z2 = b2 * x - a2 * y
+        out[i] = y
+    return z1, z2
+
+
+# Compiled _biquad_hpf: None = not probed yet, False = numba unavailable
+_hpf_kernel: Union[Callable[..., Tuple[float, float]], bool, None] = None
+
+
+def _get_hpf_kernel() -> Optional[Callable[..., Tuple[float, float]]]:
+    """Lazily compile _biquad_hpf with numba; return None if unavailable."""
+    global _hpf_kernel
+    if _hpf_kernel is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _hpf_kernel = False
+        else:
+            _hpf_kernel = njit(cache=True)(_biquad_hpf)
+    return _hpf_kernel or None
+
+
+def _hpf_gate_agc(
+    audio: np.ndarray,
+    b0: float,
+    b1: float,
+    b2: float,
+    a1: float,
+    a2: float,
+    z1: float,
+    z2: float,
+    gate_threshold: float,
+    gate_attenuation: float,
+    agc_gain: float,
+    agc_target: float,
+    agc_max_gain: float,
+    agc_smoothing: float,
+) -> Tuple[float, float, float]:
+    """
+    HPF → noise gate → AGC in place over *audio*, written for ``numba.njit``.
+
+    Pass 1 runs the biquad and accumulates the filtered energy; the gate and
+    AGC decisions are block-level, so they reduce to a single scale factor
+    applied (with the AGC clip) in pass 2.  Mirrors the staged methods on
+    AudioPreprocessor.  Returns the updated (z1, z2, agc_gain).
+    """
+    n = audio.shape[0]
+    sumsq = 0.0
+    for i in range(n):
+        x = float(audio[i])
+        y = b0 * x + z1
+        z1 = b1 * x - a1 * y + z2
+        z2 = b2 * x - a2 * y
+        audio[i] = y
+        yf = float(audio[i])  # energy of the stored float32 sample
+        sumsq += yf * yf
+
+    rms = math.sqrt(sumsq / n)
+    scale = 1.0
+    if rms < gate_threshold:
+        scale = gate_attenuation
+        rms *= gate_attenuation
+    if rms > 1e-6:
+        desired_gain = min(agc_target / rms, agc_max_gain)
+        agc_gain = agc_smoothing * agc_gain + (1.0 - agc_smoothing) * desired_gain
+    scale *= agc_gain
+
+    for i in range(n):
+        v = audio[i] * scale
+        if v > 1.0:
+            v = 1.0
+        elif v < -1.0:
+            v = -1.0
+        audio[i] = v
+    return z1, z2, agc_gain
+
+
+# Compiled _hpf_gate_agc: None = not probed yet, False = numba unavailable
+_fused_kernel: Union[Callable[..., Tuple[float, float, float]], bool, None] = None
+
+
+def _get_fused_kernel() -> Optional[Callable[..., Tuple[float, float, float]]]:
+    """Lazily compile _hpf_gate_agc with numba; return None if unavailable."""
+    global _fused_kernel
+    if _fused_kernel is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _fused_kernel = False
+        else:
+            _fused_kernel = njit(cache=True)(_hpf_gate_agc)
+    return _fused_kernel or None
+
 
 class AudioPreprocessor:
     """
@@ -77,12 +203,36 @@ class AudioPreprocessor:
         self._hpf_coeffs = self._compute_hpf_coeffs()
         self._hpf_z1: float = 0.0
         self._hpf_z2: float = 0.0
+        self._hpf_run = _get_hpf_kernel() or _biquad_hpf
+        # Fused HPF/gate/AGC kernel for process(); only worth it compiled
+        self._fused = _get_fused_kernel()
+        if self._fused is not None:
+            # Compile (or load from numba's on-disk cache) now, with the same
+            # argument types process() uses, rather than on the first mic chunk
+            self._fused(
+                np.zeros(1, dtype=np.float32),
+                *self._hpf_coeffs,
+                0.0,
+                0.0,
+                self.NOISE_GATE_THRESHOLD,
+                self.NOISE_GATE_ATTENUATION,
+                1.0,
+                self.AGC_TARGET_RMS,
+                self.AGC_MAX_GAIN,
+                self.AGC_SMOOTHING,
+            )
 
         # AGC state
         self._agc_gain: float = 1.0
 
-        # Spectral denoise (lazy-loaded)
-        self._nr_module: Optional[object] = None
+        # Spectral denoise (lazy-loaded): None = not probed yet,
+        # False = noisereduce unavailable
+        self._nr_module: Union[object, bool, None] = None
+
+        # Scratch buffers reused by process() for every chunk (grown on demand):
+        # float32 working signal and int16 output samples.
+        self._scratch_f32 = np.empty(0, dtype=np.float32)
+        self._scratch_i16 = np.empty(0, dtype=np.int16)
 
         logger.info(
             "AudioPreprocessor initialised: hpf=%dHz gate=%.4f agc_target=%.2f spectral=%s",
@@ -99,7 +249,9 @@ class AudioPreprocessor:
         Apply the full preprocessing pipeline to a PCM chunk.
 
         Args:
-            pcm_bytes: Raw LINEAR16 mono PCM at ``self.sample_rate``.
+            pcm_bytes: Raw LINEAR16 mono PCM at ``self.sample_rate``.  Any
+                       buffer-protocol object (memoryview, int16 ndarray) is
+                       read in place without an extra copy.
 
         Returns:
             Processed PCM bytes — same format and length as input.
@@ -107,16 +259,59 @@ class AudioPreprocessor:
         if len(pcm_bytes) < 2:
             return pcm_bytes
 
-        audio = pcm_bytes_to_np(pcm_bytes)
-
-        audio = self._apply_highpass(audio)
-        audio = self._apply_noise_gate(audio)
-        audio = self._apply_agc(audio)
+        samples = np.frombuffer(pcm_bytes, dtype=np.int16)
+
+        # Digital silence into a settled filter comes out as digital silence
+        # (the gate and AGC both ignore zero energy), so skip the pipeline.
+        # The filter state never decays to exactly 0.0 (it parks on denormals),
+        # so "settled" means below _HPF_SETTLED, far under one int16 LSB; the
+        # state is snapped to zero.  Louder state is a ring-down after speech
+        # and still goes through the filter.
+        if (
+            abs(self._hpf_z1) < _HPF_SETTLED
+            and abs(self._hpf_z2) < _HPF_SETTLED
+            and not samples.any()
+        ):
+            self._hpf_z1 = self._hpf_z2 = 0.0
+            return bytes(pcm_bytes)
+
+        n = samples.size
+        if self._scratch_f32.size < n:
+            self._scratch_f32 = np.empty(n, dtype=np.float32)
+            self._scratch_i16 = np.empty(n, dtype=np.int16)
+        audio = self._scratch_f32[:n]
+        pcm_out = self._scratch_i16[:n]
+
+        # int16 → float32 in [-1, 1), written straight into the scratch buffer
+        np.divide(samples, 32768.0, out=audio)
+
+        # HPF / gate / AGC all run in place on the scratch buffer
+        if self._fused is not None:
+            self._hpf_z1, self._hpf_z2, self._agc_gain = self._fused(
+                audio,
+                *self._hpf_coeffs,
+                self._hpf_z1,
+                self._hpf_z2,
+                self.NOISE_GATE_THRESHOLD,
+                self.NOISE_GATE_ATTENUATION,
+                self._agc_gain,
+                self.AGC_TARGET_RMS,
+                self.AGC_MAX_GAIN,
+                self.AGC_SMOOTHING,
+            )
+        else:
+            audio = self._apply_highpass(audio, out=audio)
+            audio = self._apply_noise_gate(audio, out=audio)
+            audio = self._apply_agc(audio, out=audio)
 
         if self._enable_spectral:
             audio = self._apply_spectral_denoise(audio)
+            # AGC already clipped; only the denoiser can leave [-1, 1]
+            np.clip(audio, -1.0, 1.0, out=audio)
 
-        return np_to_pcm_bytes(audio)
+        # float → int16 (truncating, as astype does) into the output scratch
+        np.multiply(audio, 32767, out=pcm_out, casting="unsafe")
+        return pcm_out.tobytes()
 
     # ── Stage 1: High-pass filter ─────────────────────────────────────────────
 
@@ -141,53 +336,55 @@ class AudioPreprocessor:
 
         return (b0 / a0, b1 / a0, b2 / a0, a1 / a0, a2 / a0)
 
-    def _apply_highpass(self, audio: np.ndarray) -> np.ndarray:
+    def _apply_highpass(self, audio: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Apply the biquad high-pass filter using Direct Form II transposed.
 
         Maintains z1/z2 state across calls so the filter is continuous
         across chunk boundaries (no clicks or transients at seams).
+        Writes into *out* (which may be *audio* itself) or a new array.
         """
-        b0, b1, b2, a1, a2 = self._hpf_coeffs
-        out = np.empty_like(audio)
-        z1, z2 = self._hpf_z1, self._hpf_z2
-
-        for i in range(len(audio)):
-            x = float(audio[i])
-            y = b0 * x + z1
-            z1 = b1 * x - a1 * y + z2
-            z2 = b2 * x - a2 * y
-            out[i] = y
-
-        self._hpf_z1, self._hpf_z2 = z1, z2
+        if out is None:
+            out = np.empty_like(audio)
+        self._hpf_z1, self._hpf_z2 = self._hpf_run(
+            audio, out, *self._hpf_coeffs, self._hpf_z1, self._hpf_z2
+        )
         return out
 
     # ── Stage 2: Noise gate ───────────────────────────────────────────────────
 
-    def _apply_noise_gate(self, audio: np.ndarray) -> np.ndarray:
+    def _apply_noise_gate(self, audio: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Simple RMS-based noise gate with soft attenuation.
 
         Below-threshold audio is attenuated by NOISE_GATE_ATTENUATION (-40 dB)
         rather than hard-zeroed, which avoids audible clicks at gate
-        open/close transitions.
+        open/close transitions.  The open/close decision is one scalar per
+        chunk; the energy comes from a dot product, so no squared temporary
+        is allocated.
         """
-        rms = float(np.sqrt(np.mean(audio**2)))
+        n = audio.shape[0]
+        rms = math.sqrt(float(np.dot(audio, audio)) / n) if n else 0.0
         if rms < self.NOISE_GATE_THRESHOLD:
-            return audio * self.NOISE_GATE_ATTENUATION
-        return audio
+            return np.multiply(audio, self.NOISE_GATE_ATTENUATION, out=out)
+        if out is None or out is audio:
+            return audio
+        out[:] = audio
+        return out
 
     # ── Stage 3: Automatic Gain Control ───────────────────────────────────────
 
-    def _apply_agc(self, audio: np.ndarray) -> np.ndarray:
+    def _apply_agc(self, audio: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Normalise volume with EMA-smoothed gain.
 
         Quiet audio is amplified toward AGC_TARGET_RMS, loud audio is
         compressed.  Gain changes are smoothed with an exponential moving
-        average to prevent audible "pumping".
+        average to prevent audible "pumping".  Scales and clips in place
+        into *out* when given.
         """
-        rms = float(np.sqrt(np.mean(audio**2)))
+        n = audio.shape[0]
+        rms = math.sqrt(float(np.dot(audio, audio)) / n) if n else 0.0
         if rms > 1e-6:
             desired_gain = self.AGC_TARGET_RMS / rms
             desired_gain = min(desired_gain, self.AGC_MAX_GAIN)
@@ -195,7 +392,8 @@ class AudioPreprocessor:
                 self.AGC_SMOOTHING * self._agc_gain
                 + (1.0 - self.AGC_SMOOTHING) * desired_gain
             )
-        return np.clip(audio * self._agc_gain, -1.0, 1.0)
+        scaled = np.multiply(audio, self._agc_gain, out=out)
+        return np.clip(scaled, -1.0, 1.0, out=scaled)
 
     # ── Stage 4: Spectral denoise (optional) ──────────────────────────────────
 
@@ -205,8 +403,10 @@ class AudioPreprocessor:
 
         Lazy-imports the library so there is zero cost when disabled.
         Falls back gracefully (returns audio unchanged) if the library
-        is not installed.
+        is not installed; a failed import is remembered and not retried.
         """
+        if self._nr_module is False:
+            return audio
         if self._nr_module is None:
             try:
                 import noisereduce as nr
@@ -218,6 +418,7 @@ class AudioPreprocessor:
                     "noisereduce not installed — spectral denoising disabled. "
                     "Install with: pip install noisereduce"
                 )
+                self._nr_module = False
                 self._enable_spectral = False
                 return audio
 
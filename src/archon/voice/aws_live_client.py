@@ -8,6 +8,7 @@ import os
 from contextlib import asynccontextmanager
 from typing import AsyncIterator, Optional, List, Dict
 
+from archon.voice.audio_io import compute_rms
 from archon.voice.voice_engine import AmazonVoiceEngine
 from archon.voice.gemini_live_client import ResponsePart
 from archon.manager.orchestrator import ManagerOrchestrator
@@ -30,14 +31,14 @@ class AWSLiveSession:
         self.engine = engine
         self.orchestrator = orchestrator
         self.language_code = language_code
-        self._interrupted = asyncio.Event()
+        self._interrupted: bool = False
         self._input_queue: asyncio.Queue[bytes] = asyncio.Queue()
         self._output_queue: asyncio.Queue[ResponsePart] = asyncio.Queue()
         self._running = True
 
     async def send_audio(self, pcm_bytes: bytes) -> None:
         """Queue mic audio for transcription."""
-        if self._interrupted.is_set():
+        if self._interrupted:
             return
         await self._input_queue.put(pcm_bytes)
 
@@ -47,11 +48,15 @@ class AWSLiveSession:
         pass
 
     def interrupt(self) -> None:
-        self._interrupted.set()
+        self._interrupted = True
         # Clear queues if needed
 
     def clear_interrupt(self) -> None:
-        self._interrupted.clear()
+        self._interrupted = False
+
+    @property
+    def interrupted(self) -> bool:
+        return self._interrupted
 
     async def _audio_generator(self) -> AsyncIterator[bytes]:
         while self._running:
@@ -116,8 +121,9 @@ class AWSLiveSession:
                 # Break audio into chunks for the visualizer/player
                 chunk_size = 3200  # 100ms at 16kHz
                 for i in range(0, len(audio_response), chunk_size):
+                    chunk = audio_response[i : i + chunk_size]
                     await self._output_queue.put(
-                        ResponsePart(audio=audio_response[i : i + chunk_size])
+                        ResponsePart(audio=chunk, rms=compute_rms(chunk))
                     )
 
             await self._output_queue.put(ResponsePart(is_final=True))
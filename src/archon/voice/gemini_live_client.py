@@ -25,7 +25,6 @@ System prompt is optimised for spoken J.A.R.V.I.S.-style responses:
   - Direct, confident tone
 """
 
-import asyncio
 import os
 from contextlib import asynccontextmanager
 from typing import AsyncIterator, Optional
@@ -41,6 +40,7 @@ except ImportError:
     genai = None  # type: ignore[assignment]
     genai_types = None  # type: ignore[assignment]
 
+from archon.voice.audio_io import compute_rms
 from archon.voice.response_formatter import format_for_speech
 
 # ── Constants ─────────────────────────────────────────────────────────────────
@@ -50,6 +50,7 @@ LIVE_MODEL = "gemini-2.0-flash-live-001"
 # Gemini Live API audio formats
 MIC_SAMPLE_RATE = int(os.getenv("ARCHON_VOICE_SAMPLE_RATE", "16000"))
 SPEAKER_SAMPLE_RATE = int(os.getenv("ARCHON_VOICE_PLAYBACK_RATE", "24000"))
+MIC_MIME_TYPE = f"audio/pcm;rate={MIC_SAMPLE_RATE}"
 
 JARVIS_SYSTEM_PROMPT = """You are Archon, an advanced AI coding partner — think J.A.R.V.I.S. for software development.
 
@@ -82,20 +83,24 @@ class ResponsePart:
     """
     A single chunk from the Gemini Live API response stream.
 
-    Exactly one of `audio` or `text` will be set, never both.
+    Exactly one of `audio` or `text` will be set, never both.  Audio parts
+    carry their RMS level, computed once where the chunk is decoded, so the
+    playback path can drive the visualizer without rescanning the PCM.
     """
 
-    __slots__ = ("audio", "text", "is_final")
+    __slots__ = ("audio", "text", "is_final", "rms")
 
     def __init__(
         self,
         audio: Optional[bytes] = None,
         text: Optional[str] = None,
         is_final: bool = False,
+        rms: float = 0.0,
     ) -> None:
         self.audio = audio
         self.text = text
         self.is_final = is_final
+        self.rms = rms
 
     def __repr__(self) -> str:  # pragma: no cover
         if self.audio:
@@ -113,9 +118,27 @@ class LiveSession:
     Obtained via `async with GenaiLiveClient.session() as sess`.
     """
 
-    def __init__(self, raw_session: object, interrupted: asyncio.Event) -> None:
+    def __init__(
+        self,
+        raw_session: object,
+        wants_text: bool = False,
+    ) -> None:
         self._sess = raw_session
-        self._interrupted = interrupted
+        # Barge-in flag.  Only ever set/cleared/tested (never awaited), so a
+        # plain bool keeps the per-chunk check in send_audio() free.
+        self._interrupted: bool = False
+        # Audio-only sessions (the default config) never need the text branch
+        self._wants_text = wants_text
+
+        # send_audio() runs once per mic chunk, so bind the pydantic v2
+        # model_construct fast path up front.  It skips field validation,
+        # which is safe because the PCM bytes come straight from audio_io.
+        self._realtime_input = genai_types.LiveClientRealtimeInput.model_construct
+        self._blob = genai_types.Blob.model_construct
+
+        # Staging buffer for send_audio_batch(): one long-lived bytearray,
+        # grown only when a backlog is longer than any seen before.
+        self._send_buf = bytearray()
 
     async def send_audio(self, pcm_bytes: bytes) -> None:
         """
@@ -124,9 +147,41 @@ class LiveSession:
         Args:
             pcm_bytes: LINEAR16, mono, 16 kHz PCM bytes.
         """
-        if self._interrupted.is_set():
+        if self._interrupted:
+            return  # Drop input during an interruption
+        await self._send_pcm(pcm_bytes)
+
+    async def send_audio_batch(self, pcm_chunks: list[bytes]) -> None:
+        """
+        Stream consecutive PCM chunks to Gemini as a single message.
+
+        Used when the mic loop drains a backlog: the chunks are copied into
+        the reusable staging buffer and go out in one WebSocket frame instead
+        of one per chunk.  A single chunk is sent as-is.
+
+        Args:
+            pcm_chunks: LINEAR16, mono, 16 kHz PCM chunks, in capture order.
+        """
+        if self._interrupted or not pcm_chunks:
             return  # Drop input during an interruption
-        await self._sess.send(input=genai_types.LiveClientRealtimeInput(audio=pcm_bytes))
+        if len(pcm_chunks) == 1:
+            await self._send_pcm(pcm_chunks[0])
+            return
+
+        buf = self._send_buf
+        total = sum(map(len, pcm_chunks))
+        if total > len(buf):
+            buf.extend(bytes(total - len(buf)))
+        pos = 0
+        for chunk in pcm_chunks:
+            end = pos + len(chunk)
+            buf[pos:end] = chunk
+            pos = end
+        await self._send_pcm(bytes(memoryview(buf)[:total]))
+
+    async def _send_pcm(self, pcm_bytes: bytes) -> None:
+        audio = self._blob(data=pcm_bytes, mime_type=MIC_MIME_TYPE)
+        await self._sess.send(input=self._realtime_input(audio=audio))
 
     async def end_turn(self) -> None:
         """Signal end of the user's speech turn (used in PTT/WakeWord mode)."""
@@ -148,11 +203,16 @@ class LiveSession:
         resets.  The VoiceSession is responsible for draining the speaker
         queue and re-entering the listening state.
         """
-        self._interrupted.set()
+        self._interrupted = True
 
     def clear_interrupt(self) -> None:
         """Clear the interruption flag to resume normal operation."""
-        self._interrupted.clear()
+        self._interrupted = False
+
+    @property
+    def interrupted(self) -> bool:
+        """True between interrupt() and clear_interrupt()."""
+        return self._interrupted
 
     async def receive(self) -> AsyncIterator[ResponsePart]:
         """
@@ -161,32 +221,56 @@ class LiveSession:
         Yields ResponsePart objects containing either audio bytes or text.
         Raises StopAsyncIteration when the turn is complete (is_final=True).
         """
+        # Hot loop: runs once per streamed part (dozens per second at 24 kHz),
+        # so bind globals to locals and prefer direct attribute access over
+        # getattr-with-default.
+        _RP = ResponsePart
+        _fmt = format_for_speech
+        _rms = compute_rms
+        wants_text = self._wants_text
+
         async for server_content in self._sess.receive():
-            # Handle server-sent interruption signal
+            # Handle server-sent interruption signal (cheapest check first)
             if hasattr(server_content, "interrupted") and server_content.interrupted:
-                yield ResponsePart(is_final=True)
+                yield _RP(is_final=True)
                 return
 
-            model_turn = getattr(server_content, "server_content", None)
+            try:
+                model_turn = server_content.server_content
+            except AttributeError:
+                model_turn = None
             if model_turn is None:
                 model_turn = server_content  # some SDK versions flatten this
 
-            parts = getattr(model_turn, "parts", None) or []
-            for part in parts:
-                # Audio chunk
-                inline_data = getattr(part, "inline_data", None)
-                if inline_data and getattr(inline_data, "data", None):
-                    yield ResponsePart(audio=inline_data.data)
+            try:
+                parts = model_turn.parts or ()
+            except AttributeError:
+                parts = ()
 
-                # Text chunk (fallback / transcript)
-                text = getattr(part, "text", None)
-                if text:
-                    yield ResponsePart(text=format_for_speech(text))
+            for part in parts:
+                try:
+                    inline_data = part.inline_data
+                except AttributeError:
+                    inline_data = None
+
+                if inline_data is not None:
+                    # Audio chunk
+                    data = getattr(inline_data, "data", None)
+                    if data:
+                        yield _RP(audio=data, rms=_rms(data))
+                elif wants_text:
+                    # Text chunk (fallback / transcript)
+                    text = getattr(part, "text", None)
+                    if text:
+                        yield _RP(text=_fmt(text))
 
             # End of turn signal
-            turn_complete = getattr(model_turn, "turn_complete", False)
+            try:
+                turn_complete = model_turn.turn_complete
+            except AttributeError:
+                turn_complete = False
             if turn_complete:
-                yield ResponsePart(is_final=True)
+                yield _RP(is_final=True)
                 return
 
 
@@ -265,7 +349,7 @@ class GenaiLiveClient:
             async with client.session() as sess:
                 ...
         """
-        interrupted = asyncio.Event()
         config = self._build_config()
+        wants_text = "TEXT" in (config.response_modalities or ())
         async with self._client.aio.live.connect(model=self._model, config=config) as raw_sess:
-            yield LiveSession(raw_sess, interrupted)
+            yield LiveSession(raw_sess, wants_text=wants_text)
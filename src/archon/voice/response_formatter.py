@@ -9,30 +9,121 @@ Rules applied:
   2. Expand code fences into a verbal description
   3. Cap response length at MAX_SENTENCES (unless user asks for full detail)
   4. Normalise whitespace
+
+Long responses (> _SCRUB_MIN_CHARS) route the inline-marker passes through a
+Numba-compiled byte scanner when numba is installed; otherwise the regex
+passes below are used.
 """
 
+import functools
 import re
+from typing import Callable, Optional, Union
+
+import numpy as np
 
 # Maximum number of sentences to speak by default.
 # The caller can pass full_detail=True to bypass this limit.
 MAX_SENTENCES = 4
 
+# Streamed chunks shorter than this are memoised — the Live API re-emits
+# the same short phrases constantly.  Longer texts skip the cache so it
+# never pins large strings in memory.
+_CACHE_MAX_CHARS = 2048
+_CACHE_SIZE = 512
+
+# Above this length the inline-marker passes use the compiled byte scanner.
+_SCRUB_MIN_CHARS = 2048
+
+# Bullet / numbered list line used by _list_to_prose, and every character
+# such a line can start with (for the cheap no-list pre-check)
+_BULLET_RE = re.compile(r"^(?:[-*•]|\d+\.) +(.+)$", re.MULTILINE)
+_BULLET_LEADS = "-*•0123456789"
+
+# Every character the bold/italic, code-span and link passes key on.  Text
+# containing none of them (most streamed phrases) skips those passes.
+_INLINE_MARKERS = frozenset("*_`[")
+
+# Patterns for the individual passes below
+_HEADER_RE = re.compile(r"^#{1,6}\s+", re.MULTILINE)
+_CODE_SPAN_RE = re.compile(r"`([^`\n]+)`")
+_CODE_FENCE_RE = re.compile(r"```(\w+)?\n(.*?)```", re.DOTALL)
+_LINK_RE = re.compile(r"\[([^\]]+)\]\([^)]+\)")
+_MULTI_SPACE_RE = re.compile(r" +")
+_MULTI_NEWLINE_RE = re.compile(r"\n{3,}")
+
+# ASCII byte values used by _scrub_bytes (never part of a UTF-8 multibyte run)
+_NEWLINE = 10
+_LPAREN, _RPAREN = 40, 41
+_STAR = 42
+_LBRACKET, _RBRACKET = 91, 93
+_UNDERSCORE = 95
+_BACKTICK = 96
+
+
+def _strip_emphasis(text: str, marker: str) -> str:
+    """
+    One forward scan equivalent to ``re.sub(r"M{1,3}(.*?)M{1,3}", r"\1", text)``
+    for the single-character *marker* M.
+
+    Same matching rules as the per-marker stage of _scrub_bytes: a run of up
+    to three markers opens, the body runs to the next marker on the same
+    line, and up to three markers close.  Longer runs, and unclosed "**" /
+    "***", collapse the way the regex does.
+    """
+    n = len(text)
+    out = []
+    prev = 0
+    i = text.find(marker)
+    while i >= 0:
+        r = 1
+        while i + r < n and text[i + r] == marker:
+            r += 1
+        if r > 3:
+            # Opening "***", empty body, closing run of up to three
+            out.append(text[prev:i])
+            prev = i + 3 + min(r - 3, 3)
+            i = text.find(marker, prev)
+            continue
+        j = text.find(marker, i + r)
+        if j >= 0 and text.find("\n", i + r, j) < 0:
+            out.append(text[prev:i])
+            out.append(text[i + r : j])
+            cr = 1
+            while cr < 3 and j + cr < n and text[j + cr] == marker:
+                cr += 1
+            prev = j + cr
+            i = text.find(marker, prev)
+        elif r > 1:
+            out.append(text[prev:i])  # Unclosed "**"/"***" pairs with itself and vanishes
+            prev = i + r
+            i = text.find(marker, prev)
+        else:
+            i = text.find(marker, i + 1)
+    if not out:
+        return text
+    out.append(text[prev:])
+    return "".join(out)
+
 
 def _strip_bold_italic(text: str) -> str:
     """Remove **bold** and *italic* markers."""
-    text = re.sub(r"\*{1,3}(.*?)\*{1,3}", r"\1", text)
-    text = re.sub(r"_{1,3}(.*?)_{1,3}", r"\1", text)
+    if "*" in text:
+        text = _strip_emphasis(text, "*")
+    if "_" in text:
+        text = _strip_emphasis(text, "_")
     return text
 
 
 def _strip_headers(text: str) -> str:
     """Turn '## Header text' → 'Header text'."""
-    return re.sub(r"^#{1,6}\s+", "", text, flags=re.MULTILINE)
+    return _HEADER_RE.sub("", text)
 
 
 def _strip_code_spans(text: str) -> str:
     """Replace `inline code` with just the code text."""
-    return re.sub(r"`([^`\n]+)`", r"\1", text)
+    if "`" not in text:
+        return text
+    return _CODE_SPAN_RE.sub(r"\1", text)
 
 
 def _expand_code_fences(text: str) -> str:
@@ -54,12 +145,138 @@ def _expand_code_fences(text: str) -> str:
         snippet = " ".join(lines)
         return f"Here's the {lang} — {snippet}"
 
-    return re.sub(r"```(\w+)?\n(.*?)```", _replace, text, flags=re.DOTALL)
+    if "```" not in text:
+        return text
+    return _CODE_FENCE_RE.sub(_replace, text)
 
 
 def _strip_markdown_links(text: str) -> str:
     """Turn [label](url) → 'label'."""
-    return re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", text)
+    if "](" not in text:
+        return text
+    return _LINK_RE.sub(r"\1", text)
+
+
+def _scrub_bytes(src: np.ndarray) -> np.ndarray:
+    """
+    Byte-level equivalent of _strip_bold_italic → _strip_code_spans →
+    _strip_markdown_links, written for ``numba.njit``.
+
+    Takes and returns a uint8 array of UTF-8 bytes.  Each stage is a single
+    forward scan that reproduces the matching rules of the corresponding
+    regex; stages ping-pong between two preallocated buffers.
+    """
+    n = src.shape[0]
+    a = np.empty(n, dtype=np.uint8)
+    b = np.empty(n, dtype=np.uint8)
+    a[:] = src
+
+    # Stages 1–2: paired emphasis runs, r"\*{1,3}(.*?)\*{1,3}" then for "_"
+    for m in (_STAR, _UNDERSCORE):
+        o = 0
+        i = 0
+        while i < n:
+            c = a[i]
+            if c != m:
+                b[o] = c
+                o += 1
+                i += 1
+                continue
+            r = 1
+            while i + r < n and a[i + r] == m:
+                r += 1
+            if r > 3:
+                # Opening "***", empty body, closing run of up to three
+                i += 3 + min(r - 3, 3)
+                continue
+            j = i + r
+            while j < n and a[j] != m and a[j] != _NEWLINE:
+                j += 1
+            if j < n and a[j] == m:
+                for k in range(i + r, j):
+                    b[o] = a[k]
+                    o += 1
+                cr = 1
+                while cr < 3 and j + cr < n and a[j + cr] == m:
+                    cr += 1
+                i = j + cr
+            elif r > 1:
+                i += r  # Unclosed "**"/"***" pairs with itself and vanishes
+            else:
+                b[o] = c
+                o += 1
+                i += 1
+        a, b = b, a
+        n = o
+
+    # Stage 3: code spans, r"`([^`\n]+)`"
+    o = 0
+    i = 0
+    while i < n:
+        c = a[i]
+        if c == _BACKTICK:
+            j = i + 1
+            while j < n and a[j] != _BACKTICK and a[j] != _NEWLINE:
+                j += 1
+            if j < n and a[j] == _BACKTICK and j > i + 1:
+                for k in range(i + 1, j):
+                    b[o] = a[k]
+                    o += 1
+                i = j + 1
+                continue
+        b[o] = c
+        o += 1
+        i += 1
+    a, b = b, a
+    n = o
+
+    # Stage 4: links, r"\[([^\]]+)\]\([^)]+\)"
+    o = 0
+    i = 0
+    while i < n:
+        c = a[i]
+        if c == _LBRACKET:
+            j = i + 1
+            while j < n and a[j] != _RBRACKET:
+                j += 1
+            if j > i + 1 and j + 1 < n and a[j + 1] == _LPAREN:
+                k = j + 2
+                while k < n and a[k] != _RPAREN:
+                    k += 1
+                if k < n and k > j + 2:
+                    for q in range(i + 1, j):
+                        b[o] = a[q]
+                        o += 1
+                    i = k + 1
+                    continue
+        b[o] = c
+        o += 1
+        i += 1
+
+    return b[:o]
+
+
+# Compiled _scrub_bytes: None = not probed yet, False = numba unavailable
+_scrub_kernel: Union[Callable[[np.ndarray], np.ndarray], bool, None] = None
+
+
+def _get_scrub_kernel() -> Optional[Callable[[np.ndarray], np.ndarray]]:
+    """Lazily compile _scrub_bytes with numba; return None if unavailable."""
+    global _scrub_kernel
+    if _scrub_kernel is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _scrub_kernel = False
+        else:
+            _scrub_kernel = njit(cache=True)(_scrub_bytes)
+    return _scrub_kernel or None
+
+
+def _scrub_inline_markup(text: str, kernel: Callable[[np.ndarray], np.ndarray]) -> str:
+    """Run the compiled inline-marker scanner over *text*."""
+    src = np.frombuffer(text.encode("utf-8"), dtype=np.uint8)
+    return kernel(src).tobytes().decode("utf-8")
 
 
 def _list_to_prose(text: str) -> str:
@@ -70,8 +287,14 @@ def _list_to_prose(text: str) -> str:
     * item two
     1. item three
     """
-    bullet_re = re.compile(r"^(?:[-*•]|\d+\.) +(.+)$", re.MULTILINE)
-    items = bullet_re.findall(text)
+    # Most streamed chunks contain no list at all: if no line starts with a
+    # possible bullet character, the regex cannot match.
+    if not (text and text[0] in _BULLET_LEADS) and (
+        "\n" not in text or not any("\n" + c in text for c in _BULLET_LEADS)
+    ):
+        return text
+
+    items = _BULLET_RE.findall(text)
     if not items:
         return text
     # Build comma-separated sentence
@@ -82,14 +305,16 @@ def _list_to_prose(text: str) -> str:
     else:
         prose = ", ".join(items[:-1]) + f", and {items[-1]}"
     # Remove the original list block and insert the prose
-    cleaned = bullet_re.sub("", text).strip()
+    cleaned = _BULLET_RE.sub("", text).strip()
     return f"{cleaned} {prose}".strip() if cleaned else prose
 
 
 def _normalise_whitespace(text: str) -> str:
     """Collapse excess blank lines and trailing spaces."""
-    text = re.sub(r" +", " ", text)  # multiple spaces → one
-    text = re.sub(r"\n{3,}", "\n\n", text)  # 3+ newlines → 2
+    if "  " in text:
+        text = _MULTI_SPACE_RE.sub(" ", text)  # multiple spaces → one
+    if "\n\n\n" in text:
+        text = _MULTI_NEWLINE_RE.sub("\n\n", text)  # 3+ newlines → 2
     return text.strip()
 
 
@@ -98,18 +323,74 @@ def _cap_sentences(text: str, max_sentences: int) -> str:
     Heuristically cap to the first *max_sentences* sentences.
     Sentence boundary = '. ' | '? ' | '! ' | end of string.
     """
-    # Split on sentence-ending punctuation followed by whitespace or EOS
-    parts = re.split(r"(?<=[.?!])\s+", text)
-    if len(parts) <= max_sentences:
+    # Every split point follows a terminator, so fewer terminators than the
+    # cap means nothing can be cut.
+    if text.count(".") + text.count("?") + text.count("!") < max_sentences:
         return text
-    capped = " ".join(parts[:max_sentences])
-    return capped + "."
+
+    # Walk forward to the Nth terminator-plus-whitespace boundary and stop,
+    # keeping the next position of each terminator so every find is resumed
+    # rather than repeated.  Collapsing each boundary's whitespace run to a
+    # single space matches the old split-and-join.
+    n = len(text)
+    nxt = [text.find(".", 0), text.find("?", 0), text.find("!", 0)]
+    parts: list[str] = []
+    start = 0
+    while len(parts) < max_sentences:
+        live = [p for p in nxt if p >= 0]
+        if not live:
+            return text
+        p = min(live)
+        end = p + 1
+        while end < n and text[end].isspace():
+            end += 1
+        if end > p + 1:
+            parts.append(text[start:p + 1])
+            start = end
+        for k, term in enumerate(".?!"):
+            if nxt[k] >= 0 and nxt[k] < end:
+                nxt[k] = text.find(term, end)
+    return " ".join(parts) + "."
+
+
+def _format_for_speech_impl(text: str, full_detail: bool) -> str:
+    """Uncached formatting pipeline behind format_for_speech()."""
+    # Each pass below returns its input untouched, after one C-speed
+    # substring probe, when its marker is absent — so a typical phrase is
+    # scanned by a handful of `in` checks rather than rebuilt once per pass.
+    text = _expand_code_fences(text)
+    if "#" in text:
+        text = _strip_headers(text)
+
+    kernel = _get_scrub_kernel() if len(text) > _SCRUB_MIN_CHARS else None
+    if _INLINE_MARKERS.isdisjoint(text):
+        pass  # Plain prose: nothing for the inline passes to remove
+    elif kernel is not None:
+        text = _scrub_inline_markup(text, kernel)
+    else:
+        text = _strip_bold_italic(text)
+        text = _strip_code_spans(text)
+        text = _strip_markdown_links(text)
+
+    text = _list_to_prose(text)
+    text = _normalise_whitespace(text)
+
+    if not full_detail:
+        text = _cap_sentences(text, MAX_SENTENCES)
+
+    return text
+
+
+# The pipeline is pure in (text, full_detail), so memoisation is safe.
+_format_for_speech_cached = functools.lru_cache(maxsize=_CACHE_SIZE)(_format_for_speech_impl)
 
 
 def format_for_speech(text: str, full_detail: bool = False) -> str:
     """
     Transform AI markdown output into spoken-friendly prose.
 
+    Results for short inputs (< _CACHE_MAX_CHARS) are memoised.
+
     Args:
         text:        Raw markdown string from the model.
         full_detail: If True, skip sentence-count cap.
@@ -117,15 +398,11 @@ def format_for_speech(text: str, full_detail: bool = False) -> str:
     Returns:
         Clean, readable string suitable for TTS.
     """
-    text = _expand_code_fences(text)
-    text = _strip_headers(text)
-    text = _strip_bold_italic(text)
-    text = _strip_code_spans(text)
-    text = _strip_markdown_links(text)
-    text = _list_to_prose(text)
-    text = _normalise_whitespace(text)
+    if len(text) < _CACHE_MAX_CHARS:
+        return _format_for_speech_cached(text, full_detail)
+    return _format_for_speech_impl(text, full_detail)
 
-    if not full_detail:
-        text = _cap_sentences(text, MAX_SENTENCES)
 
-    return text
+# lru_cache-style handles on the memo, e.g. for test isolation
+format_for_speech.cache_clear = _format_for_speech_cached.cache_clear  # type: ignore[attr-defined]
+format_for_speech.cache_info = _format_for_speech_cached.cache_info  # type: ignore[attr-defined]
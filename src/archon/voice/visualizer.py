@@ -9,13 +9,14 @@ States:
   THINKING   — Cyan spinner (no audio data, agent is processing)
   SPEAKING   — Blue bars driven by playback RMS
 
-The visualizer runs as a background asyncio Task and is updated by
-feeding RMS values via push_mic_rms() / push_speaker_rms().
-The caller controls state transitions with set_state().
+The visualizer renders on a background daemon thread (so terminal I/O
+never stalls the audio event loop) and is updated by feeding RMS values
+via push_mic_rms() / push_speaker_rms().  The caller controls state
+transitions with set_state().
 """
 
-import asyncio
 import math
+import threading
 import time
 from enum import Enum, auto
 from typing import Optional
@@ -44,6 +45,22 @@ _BAR_CHARS = " ▁▂▃▄▅▆▇█"
 _N_BARS = 24  # Number of bars across the waveform panel
 _FPS = 10  # Target frames per second for the live update
 _FRAME_S = 1.0 / _FPS
+_MIN_RMS = 0.05  # Floor so the waveform never collapses to a flat line
+
+# Standing-wave envelope lookup: one row per quantised phase step over a full
+# 2π period, each bar's height pre-scaled to the top _BAR_CHARS index.  The
+# animation only ever needs ~4 steps per frame, so 64 is visually lossless
+# and removes every math.sin() call from the render path.
+_PHASE_STEPS = 64
+_PHASE_SCALE = _PHASE_STEPS / (2.0 * math.pi)
+_MAX_IDX = len(_BAR_CHARS) - 1
+_ENVELOPES = tuple(
+    tuple(
+        _MAX_IDX * (0.5 + 0.5 * math.sin(math.pi * i / _N_BARS + 2.0 * math.pi * p / _PHASE_STEPS))
+        for i in range(_N_BARS)
+    )
+    for p in range(_PHASE_STEPS)
+)
 
 
 def _rms_to_bar(rms: float, phase_offset: float = 0.0) -> str:
@@ -54,14 +71,9 @@ def _rms_to_bar(rms: float, phase_offset: float = 0.0) -> str:
     waveform its oscillating shape.  `phase_offset` advances the wave
     each frame to create animation.
     """
-    chars = []
-    for i in range(_N_BARS):
-        # Standing-wave envelope: each bar's height modulated by a sin
-        envelope = 0.5 + 0.5 * math.sin(math.pi * i / _N_BARS + phase_offset)
-        level = rms * envelope
-        idx = min(int(level * (len(_BAR_CHARS) - 1)), len(_BAR_CHARS) - 1)
-        chars.append(_BAR_CHARS[idx])
-    return "".join(chars)
+    envelope = _ENVELOPES[int(phase_offset * _PHASE_SCALE) % _PHASE_STEPS]
+    chars = _BAR_CHARS
+    return "".join([chars[min(int(rms * e), _MAX_IDX)] for e in envelope])
 
 
 # ── Visualizer ────────────────────────────────────────────────────────────────
@@ -84,32 +96,69 @@ class WaveformVisualizer:
 
     def __init__(self) -> None:
         self._state: VisualizerState = VisualizerState.IDLE
-        self._mic_rms: float = 0.0
-        self._speaker_rms: float = 0.0
+        self._mic_rms: float = _MIN_RMS
+        self._speaker_rms: float = _MIN_RMS
         self._phase: float = 0.0
         self._live: Optional[Live] = None
-        self._task: Optional[asyncio.Task] = None  # type: ignore[type-arg]
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+        # Reusable renderables — _render() runs at _FPS, so the bar panels are
+        # built once and only their Text content is swapped each frame.
+        self._listening_text = Text("", style="bold green")
+        self._listening_panel = Panel(
+            self._listening_text,
+            title="🎙️  [bold green]LISTENING[/bold green]",
+            border_style="green",
+            padding=(0, 2),
+        )
+        self._speaking_text = Text("", style="bold blue")
+        self._speaking_panel = Panel(
+            self._speaking_text,
+            title="🔊  [bold blue]SPEAKING[/bold blue]",
+            border_style="blue",
+            padding=(0, 2),
+        )
+        # THINKING and IDLE are static apart from the spinner, which Live
+        # animates on its own refresh tick, so these are fully prebuilt.
+        self._thinking_panel = Panel(
+            Spinner("dots", text="  Processing...  ", style="bold cyan"),
+            title="⚙️  [bold cyan]THINKING[/bold cyan]",
+            border_style="cyan",
+            padding=(0, 2),
+        )
+        self._idle_panel = Panel(
+            Text("  " + "─" * _N_BARS + "  ", style="dim white"),
+            title="[dim]ARCHON VOICE — IDLE[/dim]",
+            border_style="dim white",
+            padding=(0, 2),
+        )
 
     # ── Context manager ────────────────────────────────────────────────────
 
     async def __aenter__(self) -> "WaveformVisualizer":
+        # Live's own auto-refresh thread is disabled: the render thread is
+        # the only one that touches the shared Text objects, and it redraws
+        # each frame itself (which also animates the THINKING spinner).
         self._live = Live(
             self._render(),
             console=console,
-            refresh_per_second=_FPS,
+            auto_refresh=False,
             transient=False,
         )
         self._live.__enter__()
-        self._task = asyncio.create_task(self._animation_loop())
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._render_loop, name="archon-visualizer", daemon=True
+        )
+        self._thread.start()
         return self
 
     async def __aexit__(self, *_: object) -> None:
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=_FRAME_S * 2)
+            self._thread = None
         if self._live:
             self._live.__exit__(None, None, None)
 
@@ -119,17 +168,20 @@ class WaveformVisualizer:
         """Switch the displayed state (thread-safe, call from event loop)."""
         self._state = state
         if state != VisualizerState.LISTENING:
-            self._mic_rms = 0.0
+            self._mic_rms = _MIN_RMS
         if state != VisualizerState.SPEAKING:
-            self._speaker_rms = 0.0
+            self._speaker_rms = _MIN_RMS
+
+    # Called per audio chunk — the floor is applied here, once, so _render()
+    # doesn't have to clamp on every frame.
 
     def push_mic_rms(self, rms: float) -> None:
         """Feed the latest mic RMS value from audio_io.compute_rms()."""
-        self._mic_rms = rms
+        self._mic_rms = rms if rms > _MIN_RMS else _MIN_RMS
 
     def push_speaker_rms(self, rms: float) -> None:
         """Feed the latest speaker RMS value."""
-        self._speaker_rms = rms
+        self._speaker_rms = rms if rms > _MIN_RMS else _MIN_RMS
 
     # ── Rendering ──────────────────────────────────────────────────────────
 
@@ -138,39 +190,30 @@ class WaveformVisualizer:
         state = self._state
 
         if state == VisualizerState.LISTENING:
-            bars = _rms_to_bar(max(self._mic_rms, 0.05), self._phase)
-            content = Text(f"  {bars}  ", style="bold green")
-            title = "🎙️  [bold green]LISTENING[/bold green]"
-            border = "green"
+            self._listening_text.plain = f"  {_rms_to_bar(self._mic_rms, self._phase)}  "
+            return self._listening_panel
 
         elif state == VisualizerState.THINKING:
-            spinner = Spinner("dots", text="  Processing...  ", style="bold cyan")
-            return Panel(
-                spinner,
-                title="⚙️  [bold cyan]THINKING[/bold cyan]",
-                border_style="cyan",
-                padding=(0, 2),
-            )
+            return self._thinking_panel
 
         elif state == VisualizerState.SPEAKING:
-            bars = _rms_to_bar(max(self._speaker_rms, 0.05), self._phase)
-            content = Text(f"  {bars}  ", style="bold blue")
-            title = "🔊  [bold blue]SPEAKING[/bold blue]"
-            border = "blue"
+            self._speaking_text.plain = f"  {_rms_to_bar(self._speaker_rms, self._phase)}  "
+            return self._speaking_panel
 
         else:  # IDLE
-            content = Text("  " + "─" * _N_BARS + "  ", style="dim white")
-            title = "[dim]ARCHON VOICE — IDLE[/dim]"
-            border = "dim white"
+            return self._idle_panel
 
-        return Panel(content, title=title, border_style=border, padding=(0, 2))
+    # ── Render loop ────────────────────────────────────────────────────────
 
-    # ── Animation loop ─────────────────────────────────────────────────────
+    def _render_loop(self) -> None:
+        """
+        Advance the phase angle and refresh the display at _FPS.
 
-    async def _animation_loop(self) -> None:
-        """Advance the phase angle and refresh the display at _FPS."""
-        while True:
-            await asyncio.sleep(_FRAME_S)
+        Runs on its own thread.  State and RMS values are plain attributes
+        written by the event loop and only read here, which is safe under
+        the GIL.
+        """
+        while not self._stop.wait(_FRAME_S):
             self._phase += 0.4  # Advance wave phase for animation
             if self._live:
-                self._live.update(self._render())
+                self._live.update(self._render(), refresh=True)
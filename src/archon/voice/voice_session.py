@@ -31,12 +31,17 @@ Slash commands (typed in the terminal even in voice mode):
 """
 
 import asyncio
+import codecs
 import logging
+import math
 import os
 import sys
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional, Tuple, Union
 
+import numpy as np
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
@@ -44,10 +49,10 @@ from rich.prompt import Prompt
 from archon.cli.session_config import VoiceActivation
 from archon.voice.activation import (
     ActivationEvent,
-    WakeWordActivator,
     build_activator,
 )
 from archon.voice.audio_io import (
+    MIC_CHUNK_FRAMES,
     AudioInputError,
     AudioOutputError,
     MicCapture,
@@ -74,6 +79,209 @@ BARGE_IN_FRAMES_REQUIRED = 4  # ~0.4 s of sustained speech
 # Available voice personas (for /voice cycling)
 VOICE_PERSONAS = ["Puck", "Kore", "Aoede", "Charon", "Fenrir"]
 
+# Minimum spacing between visualizer RMS pushes (the display redraws far
+# slower than Gemini can burst audio chunks)
+VIZ_PUSH_INTERVAL_S = 1.0 / 30
+
+# Most mic frames the forward loop will batch in one pass (~1.6 s at 100 ms)
+MIC_BATCH_FRAMES = 16
+
+
+# ── Stdin ─────────────────────────────────────────────────────────────────────
+
+
+def _register_stdin_reader(
+    loop: asyncio.AbstractEventLoop, lines: "asyncio.Queue[str]"
+) -> Optional[Callable[[], None]]:
+    """
+    Have the event loop push each stdin line into *lines* as it arrives.
+
+    stdin is switched to non-blocking and read with os.read(), so one
+    callback hands over every complete line that arrived together and a
+    partial line waits in a carry-over buffer instead of blocking the loop.
+    EOF is signalled by pushing "".
+
+    Returns a callable that unregisters the reader and restores stdin's
+    blocking mode, or None when stdin can't be watched this way (Windows, a
+    non-selectable stdin such as a file or pytest capture), in which case
+    the caller reads through the default executor instead.
+    """
+    if sys.platform == "win32":
+        return None
+    try:
+        fd = sys.stdin.fileno()
+        was_blocking = os.get_blocking(fd)
+    except (AttributeError, ValueError, OSError):
+        return None
+
+    decoder = codecs.getincrementaldecoder(sys.stdin.encoding or "utf-8")(errors="replace")
+    carry = ""  # Partial line awaiting its newline
+
+    def _on_readable() -> None:
+        nonlocal carry
+        try:
+            data = os.read(fd, 4096)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            data = b""
+        if not data:
+            loop.remove_reader(fd)
+            carry += decoder.decode(b"", final=True)
+            if carry:
+                lines.put_nowait(carry)
+            lines.put_nowait("")  # EOF
+            return
+        *complete, carry = (carry + decoder.decode(data)).split("\n")
+        for line in complete:
+            lines.put_nowait(line + "\n")
+
+    try:
+        os.set_blocking(fd, False)
+        loop.add_reader(fd, _on_readable)
+    except (ValueError, OSError, NotImplementedError):
+        os.set_blocking(fd, was_blocking)
+        return None
+
+    def _unregister() -> None:
+        loop.remove_reader(fd)
+        os.set_blocking(fd, was_blocking)
+
+    return _unregister
+
+
+# ── Loop state ────────────────────────────────────────────────────────────────
+
+
+@dataclass
+class _LoopState:
+    """Flags shared between the mic loop and the activation consumer."""
+
+    forwarding: bool = False
+    running: bool = True
+
+
+class _SessionEnded(Exception):
+    """Raised inside the session TaskGroup to cancel the remaining loops."""
+
+
+# Errors run() reports with a friendly message; the TaskGroup hands them back
+# wrapped in an ExceptionGroup, so _main_loop unwraps them first.
+_REPORTED_ERRORS = (AudioInputError, AudioOutputError, LiveAPIKeyError, LiveAPIUnavailableError)
+
+
+def _first_leaf(group: BaseExceptionGroup) -> BaseException:
+    """Return the first non-group exception in a (possibly nested) group."""
+    exc: BaseException = group
+    while isinstance(exc, BaseExceptionGroup):
+        exc = exc.exceptions[0]
+    return exc
+
+
+# ── Mic frame batching ────────────────────────────────────────────────────────
+
+
+def _rms_over_threshold(
+    frames: np.ndarray, sumsq_thresh: float, rms_out: np.ndarray, loud_out: np.ndarray
+) -> None:
+    """
+    Per-frame RMS in [0, 1] and barge-in threshold test, fused into a single
+    pass over each int16 row.  The threshold is pre-scaled to a raw sum of
+    squares, so the test needs no sqrt or divide.  Written for ``numba.njit``.
+    """
+    k, n = frames.shape
+    for r in range(k):
+        acc = 0.0
+        for i in range(n):
+            x = float(frames[r, i])
+            acc += x * x
+        loud_out[r] = acc > sumsq_thresh
+        rms = math.sqrt(acc / n) / 32768.0
+        if rms > 1.0:
+            rms = 1.0
+        rms_out[r] = rms
+
+
+# Compiled _rms_over_threshold: None = not probed yet, False = numba unavailable
+_rms_kernel: Union[Callable[..., None], bool, None] = None
+
+
+def _get_rms_kernel() -> Optional[Callable[..., None]]:
+    """Lazily compile _rms_over_threshold with numba; return None if unavailable."""
+    global _rms_kernel
+    if _rms_kernel is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _rms_kernel = False
+        else:
+            _rms_kernel = njit(cache=True, fastmath=True)(_rms_over_threshold)
+    return _rms_kernel or None
+
+
+class _MicFrameBuffer:
+    """
+    Preallocated int16 frame matrix for batched mic RMS.
+
+    When the forward loop falls behind, every queued frame is copied into
+    one row of this buffer and the RMS of all rows is computed in a single
+    vectorised pass instead of one compute_rms() call per frame.  With
+    numba installed the RMS and barge-in threshold test are fused into one
+    compiled pass.
+    """
+
+    __slots__ = (
+        "_frames",
+        "_squares",
+        "_rms",
+        "_loud",
+        "_kernel",
+        "_sumsq_thresh",
+        "frame_bytes",
+    )
+
+    def __init__(self, capacity: int = MIC_BATCH_FRAMES, frame_len: int = MIC_CHUNK_FRAMES) -> None:
+        self._frames = np.empty((capacity, frame_len), dtype=np.int16)
+        self._squares = np.empty((capacity, frame_len), dtype=np.float32)
+        self._rms = np.empty(capacity, dtype=np.float64)
+        self._loud = np.empty(capacity, dtype=np.bool_)
+        self.frame_bytes = frame_len * 2
+        # BARGE_IN_RMS_THRESHOLD as a raw int16 sum of squares over one frame
+        self._sumsq_thresh = (BARGE_IN_RMS_THRESHOLD * 32768.0) ** 2 * frame_len
+        # Resolve (and, on first use, compile) the kernel here, so building
+        # the buffer before the mic opens keeps the JIT off the first frame.
+        self._kernel = _get_rms_kernel()
+        if self._kernel is not None:
+            self._kernel(self._frames[:1], 1.0, self._rms[:1], self._loud[:1])
+
+    def measure(self, chunks: list[bytes]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        RMS in [0, 1] of each PCM chunk (matching compute_rms()) and whether
+        it exceeds BARGE_IN_RMS_THRESHOLD.
+        """
+        k = len(chunks)
+        if k > len(self._frames) or any(len(c) != self.frame_bytes for c in chunks):
+            # Odd-sized or oversized batch — not worth a special layout
+            rms = np.array([compute_rms(c) for c in chunks], dtype=np.float32)
+            return rms, rms > BARGE_IN_RMS_THRESHOLD
+        frames = self._frames[:k]
+        for row, chunk in zip(frames, chunks):
+            row[:] = np.frombuffer(chunk, dtype=np.int16)
+
+        if self._kernel is not None:
+            rms, loud = self._rms[:k], self._loud[:k]
+            self._kernel(frames, self._sumsq_thresh, rms, loud)
+            return rms, loud
+
+        squares = self._squares[:k]
+        np.multiply(frames, frames, out=squares, dtype=np.float32)
+        sumsq = squares.sum(axis=1, dtype=np.float64)
+        loud = sumsq > self._sumsq_thresh
+        rms = np.sqrt(sumsq / frames.shape[1])
+        rms /= 32768.0
+        np.minimum(rms, 1.0, out=rms)
+        return rms, loud
+
 
 # ── VoiceSession ──────────────────────────────────────────────────────────────
 
@@ -105,10 +313,23 @@ class VoiceSession:
 
         # Runtime state
         self._running = True
+        self._state = _LoopState()
         self._voice_idx = (
             VOICE_PERSONAS.index(self.voice_name) if self.voice_name in VOICE_PERSONAS else 0
         )
 
+        # Slash-command dispatch (typed input, lower-cased and stripped)
+        self._slash_table: dict[str, Callable[[], None]] = {
+            "/exit": self._cmd_exit,
+            "/quit": self._cmd_exit,
+            "exit": self._cmd_exit,
+            "quit": self._cmd_exit,
+            "/voice": self._cmd_voice,
+            "/text": self._cmd_text,
+            "/activation": self._cmd_activation,
+            "/help": self._cmd_help,
+        }
+
     # ── Public entrypoint ──────────────────────────────────────────────────
 
     async def run(self) -> None:
@@ -153,6 +374,9 @@ class VoiceSession:
         )
         logger.info("Audio preprocessor ready")
 
+        # Built (and its RMS kernel warmed) before the mic opens
+        frame_buf = _MicFrameBuffer()
+
         async with (
             WaveformVisualizer() as viz,
             MicCapture() as mic,
@@ -160,24 +384,61 @@ class VoiceSession:
         ):
             await activator.start()
 
-            slash_task = asyncio.create_task(self._watch_slash_commands(viz))
-
             viz.set_state(VisualizerState.LISTENING)
 
+            self._state = _LoopState(forwarding=self.activation_mode == VoiceActivation.VAD)
+
             try:
-                async with client.session() as sess:
-                    # Concurrent tasks
-                    mic_fwd_task = asyncio.create_task(
-                        self._mic_forward_loop(mic, activator, viz, sess, preprocessor)
+                async with client.session() as sess, asyncio.TaskGroup() as tg:
+                    # Concurrent tasks — the group cancels them all at once
+                    # if any one fails.
+                    tg.create_task(self._activation_consumer(activator, viz, sess, self._state))
+                    tg.create_task(self._receive_loop(sess, speaker, viz))
+                    tg.create_task(self._watch_slash_commands(viz))
+
+                    # The mic loop is the one that notices self._running going
+                    # False (or the mic closing); when it returns, tear down
+                    # the rest of the group.
+                    await self._mic_forward_loop(
+                        mic, activator, viz, sess, preprocessor, frame_buf
                     )
-                    recv_task = asyncio.create_task(self._receive_loop(sess, speaker, viz))
-
-                    await asyncio.gather(mic_fwd_task, recv_task, slash_task)
-
+                    raise _SessionEnded
+            except* _SessionEnded:
+                pass
+            except* _REPORTED_ERRORS as eg:
+                raise _first_leaf(eg) from None
             finally:
-                slash_task.cancel()
                 await activator.stop()
 
+    # ── Activation consumer task ───────────────────────────────────────────
+
+    async def _activation_consumer(
+        self,
+        activator,
+        viz: WaveformVisualizer,
+        sess: LiveSession,
+        state: _LoopState,
+    ) -> None:
+        """
+        Apply activation events as they arrive.
+
+        Owns every forwarding/visualizer transition driven by the activator,
+        so the mic loop only has to read `state.forwarding`.
+        """
+        while state.running:
+            event = await activator.next_event()
+            if event == ActivationEvent.LISTENING_START:
+                state.forwarding = True
+                viz.set_state(VisualizerState.LISTENING)
+                sess.clear_interrupt()
+            elif event == ActivationEvent.LISTENING_END:
+                state.forwarding = False
+                await sess.end_turn()
+                viz.set_state(VisualizerState.THINKING)
+            elif event == ActivationEvent.EXIT:
+                state.running = False
+                self._running = False
+
     # ── Mic forwarding task ────────────────────────────────────────────────
 
     async def _mic_forward_loop(
@@ -187,61 +448,68 @@ class VoiceSession:
         viz: WaveformVisualizer,
         sess: LiveSession,
         preprocessor: AudioPreprocessor,
+        frame_buf: _MicFrameBuffer,
     ) -> None:
         """
         Continuously reads from mic, preprocesses, and forwards to Gemini.
 
         Audio flow:
-          raw chunk → compute_rms (for viz + barge-in on RAW signal)
+          raw chunk → batched RMS (for viz + barge-in on RAW signal)
                     → preprocessor.process (HPF → gate → AGC → spectral)
-                    → sess.send_audio (clean audio to Gemini)
+                    → sess.send_audio_batch (clean audio to Gemini, one
+                      message per batch)
         """
-        forwarding = self.activation_mode == VoiceActivation.VAD
+        state = self._state
         barge_in_streak = 0
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        monotonic = time.monotonic
+        last_viz_push = 0.0
 
-        async for chunk in mic:
+        async for first in mic:
             if not self._running:
                 break
 
-            # RMS from RAW audio — visualiser and barge-in need real mic levels
-            rms = compute_rms(chunk)
-            viz.push_mic_rms(rms)
+            # Normally a batch of one; after a stall, every frame that queued
+            # up behind this one is handled together.
+            batch = [first]
+            batch.extend(mic.drain_nowait())
 
-            # Feed raw PCM to wake-word activator (needs audio, not just RMS)
-            if isinstance(activator, WakeWordActivator):
+            # RMS from RAW audio — visualiser and barge-in need real mic levels
+            batch_rms, loud = frame_buf.measure(batch)
+            now = monotonic()
+            if now - last_viz_push > VIZ_PUSH_INTERVAL_S:
+                viz.push_mic_rms(float(batch_rms[-1]))
+                last_viz_push = now
+
+            # Clean audio for this batch, sent as one message at the end
+            outgoing: list[bytes] = []
+            for i, chunk in enumerate(batch):
+                # Feed raw PCM to the activator (wake-word needs audio, not just
+                # RMS; the other modes ignore it)
                 activator.push_audio(chunk)
 
-            # Check for activation events (non-blocking)
-            while not activator._events.empty():
-                event = activator._events.get_nowait()
-                if event == ActivationEvent.LISTENING_START:
-                    forwarding = True
-                    viz.set_state(VisualizerState.LISTENING)
-                    sess.clear_interrupt()
-                elif event == ActivationEvent.LISTENING_END:
-                    forwarding = False
-                    await sess.end_turn()
-                    viz.set_state(VisualizerState.THINKING)
-                elif event in (ActivationEvent.EXIT,):
-                    self._running = False
-                    return
-
-            # Barge-in detection: loud mic while speaker is playing
-            if viz._state == VisualizerState.SPEAKING:
-                if rms > BARGE_IN_RMS_THRESHOLD:
-                    barge_in_streak += 1
-                    if barge_in_streak >= BARGE_IN_FRAMES_REQUIRED:
-                        sess.interrupt()
-                        viz.set_state(VisualizerState.LISTENING)
+                # Barge-in detection: loud mic while speaker is playing
+                if viz._state == VisualizerState.SPEAKING:
+                    if loud[i]:
+                        barge_in_streak += 1
+                        if barge_in_streak >= BARGE_IN_FRAMES_REQUIRED:
+                            # Audio from before the barge-in still goes out
+                            await sess.send_audio_batch(outgoing)
+                            outgoing.clear()
+                            sess.interrupt()
+                            viz.set_state(VisualizerState.LISTENING)
+                            barge_in_streak = 0
+                            if debug_enabled:
+                                logger.debug("Barge-in triggered (RMS=%.3f)", batch_rms[i])
+                    else:
                         barge_in_streak = 0
-                        logger.debug("Barge-in triggered (RMS=%.3f)", rms)
-                else:
-                    barge_in_streak = 0
 
-            # Preprocess and forward to Gemini
-            if forwarding:
-                clean_chunk = preprocessor.process(chunk)
-                await sess.send_audio(clean_chunk)
+                # Preprocess for Gemini (in order — PCM must not reorder)
+                if state.forwarding:
+                    outgoing.append(preprocessor.process(chunk))
+
+            if outgoing:
+                await sess.send_audio_batch(outgoing)
 
     # ── Receive loop task ──────────────────────────────────────────────────
 
@@ -252,6 +520,8 @@ class VoiceSession:
         viz: WaveformVisualizer,
     ) -> None:
         """Receives audio/text from Gemini and plays it."""
+        monotonic = time.monotonic
+        last_viz_push = 0.0
         while self._running:
             async for part in sess.receive():
                 if not self._running:
@@ -268,13 +538,15 @@ class VoiceSession:
                     if viz._state != VisualizerState.SPEAKING:
                         viz.set_state(VisualizerState.SPEAKING)
                     # Check barge-in flag
-                    if sess._interrupted.is_set():
+                    if sess.interrupted:
                         speaker.clear()
                         sess.clear_interrupt()
                         viz.set_state(VisualizerState.LISTENING)
                         break
-                    rms = compute_rms(part.audio)
-                    viz.push_speaker_rms(rms)
+                    now = monotonic()
+                    if now - last_viz_push > VIZ_PUSH_INTERVAL_S:
+                        viz.push_speaker_rms(part.rms)
+                        last_viz_push = now
                     await speaker.play(part.audio)
 
                 elif part.text:
@@ -289,52 +561,65 @@ class VoiceSession:
         Runs in a separate asyncio task so it doesn't block audio.
         """
         loop = asyncio.get_running_loop()
-        while self._running:
-            try:
-                # stdin read in executor to avoid blocking the event loop
-                line = await loop.run_in_executor(None, sys.stdin.readline)
-            except (EOFError, OSError):
-                break
+        lines: asyncio.Queue[str] = asyncio.Queue()
+        unregister_stdin = _register_stdin_reader(loop, lines)
+        try:
+            while self._running:
+                if unregister_stdin is not None:
+                    line = await lines.get()
+                else:
+                    try:
+                        # stdin read in executor to avoid blocking the event loop
+                        line = await loop.run_in_executor(None, sys.stdin.readline)
+                    except (EOFError, OSError):
+                        break
+                if not line:
+                    break  # EOF — stdin closed
 
-            cmd = line.strip().lower()
+                handler = self._slash_table.get(line.strip().lower())
+                if handler:
+                    handler()
+        finally:
+            if unregister_stdin is not None:
+                unregister_stdin()
 
-            if cmd in ("/exit", "/quit", "exit", "quit"):
-                self._running = False
-                break
+    # ── Slash command handlers ─────────────────────────────────────────────
 
-            elif cmd == "/voice":
-                self._voice_idx = (self._voice_idx + 1) % len(VOICE_PERSONAS)
-                self.voice_name = VOICE_PERSONAS[self._voice_idx]
-                console.print(
-                    f"\n[bold color(201)]🎙  Voice changed to {self.voice_name}[/bold color(201)]"
-                    "\n[dim]Takes effect on next session restart.[/dim]\n"
-                )
+    def _cmd_exit(self) -> None:
+        self._running = False
 
-            elif cmd == "/text":
-                console.print("\n[bold cyan]Switching to text mode...[/bold cyan]")
-                self._running = False
-                break
+    def _cmd_voice(self) -> None:
+        self._voice_idx = (self._voice_idx + 1) % len(VOICE_PERSONAS)
+        self.voice_name = VOICE_PERSONAS[self._voice_idx]
+        console.print(
+            f"\n[bold color(201)]🎙  Voice changed to {self.voice_name}[/bold color(201)]"
+            "\n[dim]Takes effect on next session restart.[/dim]\n"
+        )
 
-            elif cmd == "/activation":
-                modes = list(VoiceActivation)
-                cur_idx = modes.index(self.activation_mode)
-                self.activation_mode = modes[(cur_idx + 1) % len(modes)]
-                console.print(
-                    f"\n[bold color(82)]✓ Activation mode → {self.activation_mode.value}[/bold color(82)]"
-                    "\n[dim]Takes effect on next session restart.[/dim]\n"
-                )
-
-            elif cmd == "/help":
-                console.print(
-                    Panel(
-                        "  [bold color(201)]/voice[/bold color(201)]      — Cycle voice persona (Puck→Kore→Aoede→Charon→Fenrir)\n"
-                        "  [bold color(39)]/activation[/bold color(39)] — Switch activation mode (VAD→PTT→WakeWord)\n"
-                        "  [bold white]/text[/bold white]       — Return to text REPL\n"
-                        "  [bold white]/exit[/bold white]       — Quit Archon voice session",
-                        title="[bold]Voice Commands[/bold]",
-                        border_style="color(201)",
-                    )
-                )
+    def _cmd_text(self) -> None:
+        console.print("\n[bold cyan]Switching to text mode...[/bold cyan]")
+        self._running = False
+
+    def _cmd_activation(self) -> None:
+        modes = list(VoiceActivation)
+        cur_idx = modes.index(self.activation_mode)
+        self.activation_mode = modes[(cur_idx + 1) % len(modes)]
+        console.print(
+            f"\n[bold color(82)]✓ Activation mode → {self.activation_mode.value}[/bold color(82)]"
+            "\n[dim]Takes effect on next session restart.[/dim]\n"
+        )
+
+    def _cmd_help(self) -> None:
+        console.print(
+            Panel(
+                "  [bold color(201)]/voice[/bold color(201)]      — Cycle voice persona (Puck→Kore→Aoede→Charon→Fenrir)\n"
+                "  [bold color(39)]/activation[/bold color(39)] — Switch activation mode (VAD→PTT→WakeWord)\n"
+                "  [bold white]/text[/bold white]       — Return to text REPL\n"
+                "  [bold white]/exit[/bold white]       — Quit Archon voice session",
+                title="[bold]Voice Commands[/bold]",
+                border_style="color(201)",
+            )
+        )
 
     # ── Welcome banner ─────────────────────────────────────────────────────
 
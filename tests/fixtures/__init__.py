@@ -8,6 +8,7 @@ from tests.fixtures.schemas import (
     create_sample_conflict,
     create_sample_agent_proposal,
     create_task_batch,
+    reset_ids,
 )
 
 __all__ = [
@@ -18,4 +19,5 @@ __all__ = [
     "create_sample_conflict",
     "create_sample_agent_proposal",
     "create_task_batch",
+    "reset_ids",
 ]
@@ -7,7 +7,7 @@ be overridden as needed.
 
 from datetime import datetime
 from typing import Any, Dict, List, Optional
-import uuid
+import itertools
 
 from archon.utils.schemas import (
     Task,
@@ -25,6 +25,21 @@ from archon.utils.schemas import (
 )
 
 
+# Per-process ID counter: cheaper than uuid4() and reproducible across runs.
+_counter = itertools.count()
+
+
+def _test_id(prefix: str) -> str:
+    """Return the next sequential test ID, e.g. ``task_0000002a``."""
+    return f"{prefix}_{next(_counter):08x}"
+
+
+def reset_ids() -> None:
+    """Restart the ID sequence (for tests that assert exact ID strings)."""
+    global _counter
+    _counter = itertools.count()
+
+
 def create_sample_task(
     task_id: Optional[str] = None,
     description: str = "Test task description",
@@ -57,7 +72,7 @@ def create_sample_task(
         A Task instance with the specified or default values
     """
     return Task(
-        task_id=task_id or f"task_{uuid.uuid4().hex[:8]}",
+        task_id=task_id or _test_id("task"),
         description=description,
         agent_type=agent_type,
         model_assigned=model_assigned,
@@ -103,7 +118,7 @@ def create_sample_task_result(
         A TaskResult instance with the specified or default values
     """
     return TaskResult(
-        task_id=task_id or f"task_{uuid.uuid4().hex[:8]}",
+        task_id=task_id or _test_id("task"),
         success=success,
         output=output or {"result": "Test output", "details": {}},
         files_modified=files_modified or [],
@@ -206,11 +221,11 @@ def create_sample_conflict(
         ]
 
     return Conflict(
-        conflict_id=conflict_id or f"conflict_{uuid.uuid4().hex[:8]}",
+        conflict_id=conflict_id or _test_id("conflict"),
         conflict_type=conflict_type,
         agents_involved=agents_involved or ["backend", "architect"],
         proposals=proposals,
-        task_id=task_id or f"task_{uuid.uuid4().hex[:8]}",
+        task_id=task_id or _test_id("task"),
     )
 
 
@@ -236,7 +251,7 @@ def create_sample_decision(
         A Decision instance with the specified or default values
     """
     return Decision(
-        conflict_id=conflict_id or f"conflict_{uuid.uuid4().hex[:8]}",
+        conflict_id=conflict_id or _test_id("conflict"),
         chosen_agent=chosen_agent,
         chosen_proposal=chosen_proposal,
         reasoning=reasoning,
@@ -395,28 +410,28 @@ def create_task_batch(
     Returns:
         A list of Task instances
     """
+    # Every field is built here from known-good values, so skip pydantic
+    # validation and share one timestamp across the batch.
     agent_types = list(AgentType)
-    tasks = []
-
-    for i in range(count):
-        task_id = f"batch_task_{i:03d}"
-
-        # Cycle through agent types if not specified
-        task_agent_type = agent_type or agent_types[i % len(agent_types)]
-        task_status = status or TaskStatus.PENDING
+    n_types = len(agent_types)
+    task_status = status or TaskStatus.PENDING
+    now = datetime.now()
 
-        # Add dependency on previous task if requested
-        dependencies = []
-        if with_dependencies and i > 0:
-            dependencies = [f"batch_task_{i-1:03d}"]
-
-        task = create_sample_task(
-            task_id=task_id,
+    return [
+        Task.model_construct(
+            task_id=f"batch_task_{i:03d}",
             description=f"Batch test task {i + 1}",
-            agent_type=task_agent_type,
+            # Cycle through agent types if not specified
+            agent_type=agent_type or agent_types[i % n_types],
+            model_assigned=None,
+            tool_assigned=None,
             status=task_status,
-            dependencies=dependencies,
+            # Add dependency on previous task if requested
+            dependencies=[f"batch_task_{i-1:03d}"] if with_dependencies and i > 0 else [],
+            quality_threshold=0.8,
+            context={},
+            created_at=now,
+            completed_at=None,
         )
-        tasks.append(task)
-
-    return tasks
+        for i in range(count)
+    ]
@@ -4,33 +4,75 @@ Conftest for voice unit tests.
 Stubs chromadb before pytest collects modules so the pre-existing
 chromadb/NumPy2 incompatibility doesn't block voice-layer tests.
 The archon package itself is NOT stubbed — only chromadb is.
+
+Also empties the format_for_speech memo before every test.
 """
 
+import importlib.abc
+import importlib.machinery
 import sys
 import types
 from pathlib import Path
 
+import pytest
+
 # Ensure the installed archon package (via poetry) is used.
 # The pyproject editable install handles this via the venv; no sys.path
 # manipulation is needed when running via `poetry run pytest`.
 
 # ── Stub chromadb so the chromadb→NumPy2 crash never fires ───────────────────
 
-_CHROMADB_MODULES = [
-    "chromadb",
-    "chromadb.api",
-    "chromadb.api.client",
-    "chromadb.api.models",
-    "chromadb.api.models.Collection",
-    "chromadb.config",
-    "chromadb.utils",
-    "chromadb.utils.embedding_functions",
-    "chromadb.api.types",
-]
-
-for _name in _CHROMADB_MODULES:
-    if _name not in sys.modules:
-        _stub = types.ModuleType(_name)
+_CHROMADB_MODULES = frozenset(
+    {
+        "chromadb",
+        "chromadb.api",
+        "chromadb.api.client",
+        "chromadb.api.models",
+        "chromadb.api.models.Collection",
+        "chromadb.config",
+        "chromadb.utils",
+        "chromadb.utils.embedding_functions",
+        "chromadb.api.types",
+    }
+)
+
+
+class _ChromadbStubFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """
+    Answers imports of the _CHROMADB_MODULES names with an empty stub module,
+    built only when something actually imports it.
+
+    Sits ahead of the regular finders so the real (NumPy2-incompatible)
+    package is never executed, even when it is installed.  Other names are
+    left alone so `from chromadb.config import Settings` still raises
+    ImportError rather than resolving to a stub submodule.
+    """
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname not in _CHROMADB_MODULES:
+            return None
+        # Every stub is a package so nested `import chromadb.x.y` resolves
+        return importlib.machinery.ModuleSpec(fullname, self, is_package=True)
+
+    def create_module(self, spec):
+        return None  # default module creation
+
+    def exec_module(self, module: types.ModuleType) -> None:
         # Provide a no-op Client class so any `import chromadb; chromadb.Client()` works
-        _stub.Client = object  # type: ignore[attr-defined]
-        sys.modules[_name] = _stub
+        module.Client = object  # type: ignore[attr-defined]
+
+
+if "chromadb" not in sys.modules:
+    sys.meta_path.insert(0, _ChromadbStubFinder())
+
+
+# ── Per-test formatter memo ───────────────────────────────────────────────────
+
+
+@pytest.fixture(autouse=True)
+def _clear_format_for_speech_cache():
+    """Start every test with an empty format_for_speech memo."""
+    from archon.voice.response_formatter import format_for_speech
+
+    format_for_speech.cache_clear()
+    yield
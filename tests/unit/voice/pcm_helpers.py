@@ -0,0 +1,43 @@
+"""
+Shared PCM generators for the voice unit tests.
+
+All generators are memoised: they are pure, and bytes are immutable, so
+callers may only read what they get back.
+"""
+
+import functools
+import math
+
+import numpy as np
+
+
+@functools.lru_cache(maxsize=64)
+def pcm_const(value: int, n_samples: int) -> bytes:
+    """PCM bytes of *n_samples* int16 samples all equal to *value*."""
+    if value == 0:
+        return bytes(2 * n_samples)
+    return np.full(n_samples, value, dtype=np.int16).tobytes()
+
+
+@functools.lru_cache(maxsize=None)
+def sine_pcm(freq_hz: float, duration_s: float = 0.1, sample_rate: int = 16_000) -> bytes:
+    """Full-scale sine wave at *freq_hz*, synthesised in float64."""
+    n_samples = int(sample_rate * duration_s)
+    t = np.arange(n_samples, dtype=np.float64) / sample_rate
+    wave = np.sin(2.0 * math.pi * freq_hz * t)
+    pcm_int16 = (wave * 32767).astype(np.int16)
+    return pcm_int16.tobytes()
+
+
+@functools.lru_cache(maxsize=32)
+def tone_pcm(freq: float, duration_ms: int, sample_rate: int, amplitude: float) -> bytes:
+    """Sine tone at *amplitude* of full scale, synthesised in float32."""
+    n_samples = int(sample_rate * duration_ms / 1000)
+    # Synthesise in place in one float32 buffer: t → phase → sin → scaled
+    signal = np.arange(n_samples, dtype=np.float32)
+    signal /= sample_rate
+    signal *= 2 * np.pi * freq
+    np.sin(signal, out=signal)
+    signal *= amplitude
+    signal *= 32767
+    return signal.astype(np.int16).tobytes()
@@ -18,6 +18,7 @@ from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pytest
+import pytest_asyncio
 
 from archon.cli.session_config import VoiceActivation
 from archon.voice.activation import (
@@ -28,15 +29,17 @@ from archon.voice.activation import (
     _BaseActivator,
     build_activator,
 )
+from tests.unit.voice.pcm_helpers import pcm_const, tone_pcm
 
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
+_CHUNK_SAMPLES = 1600  # 100 ms at 16 kHz, the size every helper below produces
+
 
 def _make_pcm_silence(duration_ms: int = 100, sample_rate: int = 16000) -> bytes:
-    """Generate silent PCM bytes (all zeros)."""
-    n_samples = int(sample_rate * duration_ms / 1000)
-    return np.zeros(n_samples, dtype=np.int16).tobytes()
+    """Generate silent PCM bytes (all zeros). Cached — callers only read it."""
+    return pcm_const(0, int(sample_rate * duration_ms / 1000))
 
 
 def _make_pcm_tone(
@@ -45,11 +48,13 @@ def _make_pcm_tone(
     sample_rate: int = 16000,
     amplitude: float = 0.5,
 ) -> bytes:
-    """Generate a sine tone as PCM bytes."""
-    n_samples = int(sample_rate * duration_ms / 1000)
-    t = np.arange(n_samples, dtype=np.float32) / sample_rate
-    signal = (amplitude * np.sin(2 * np.pi * freq * t) * 32767).astype(np.int16)
-    return signal.tobytes()
+    """Generate a sine tone as PCM bytes. Cached — callers only read it."""
+    return tone_pcm(freq, duration_ms, sample_rate, amplitude)
+
+
+async def _await_event(activator: _BaseActivator, timeout: float = 0.5) -> ActivationEvent:
+    """Wait for the next activation event (raises TimeoutError if none arrives)."""
+    return await asyncio.wait_for(activator.next_event(), timeout)
 
 
 # ── TestVADActivator ──────────────────────────────────────────────────────────
@@ -58,21 +63,18 @@ def _make_pcm_tone(
 class TestVADActivator:
     """VAD mode: always-on, single LISTENING_START on start()."""
 
-    @pytest.mark.asyncio
     async def test_start_emits_listening_start(self):
         activator = VADActivator()
         await activator.start()
         event = activator._events.get_nowait()
         assert event == ActivationEvent.LISTENING_START
 
-    @pytest.mark.asyncio
     async def test_signal_playback_interrupted(self):
         activator = VADActivator()
         activator.signal_playback_interrupted()
         event = activator._events.get_nowait()
         assert event == ActivationEvent.INTERRUPTED
 
-    @pytest.mark.asyncio
     async def test_queue_empty_after_drain(self):
         activator = VADActivator()
         await activator.start()
@@ -86,7 +88,6 @@ class TestVADActivator:
 class TestPTTActivator:
     """Push-to-Talk mode: keyboard events → activation events."""
 
-    @pytest.mark.asyncio
     async def test_ptt_missing_pynput_raises(self):
         """If pynput is not available, start() should raise ImportError."""
         activator = PTTActivator()
@@ -95,7 +96,6 @@ class TestPTTActivator:
             with pytest.raises(ImportError, match="pynput"):
                 await activator.start()
 
-    @pytest.mark.asyncio
     async def test_ptt_press_emits_listening_start(self):
         """Simulating SPACE press should emit LISTENING_START."""
         activator = PTTActivator()
@@ -109,7 +109,6 @@ class TestPTTActivator:
         event = activator._events.get_nowait()
         assert event == ActivationEvent.LISTENING_START
 
-    @pytest.mark.asyncio
     async def test_ptt_release_emits_listening_end(self):
         """Simulating SPACE release should emit LISTENING_END."""
         activator = PTTActivator()
@@ -125,7 +124,6 @@ class TestPTTActivator:
         event = activator._events.get_nowait()
         assert event == ActivationEvent.LISTENING_END
 
-    @pytest.mark.asyncio
     async def test_ptt_ignores_non_space(self):
         """Non-SPACE keys should not trigger events."""
         activator = PTTActivator()
@@ -134,7 +132,6 @@ class TestPTTActivator:
         assert activator._events.empty()
         assert activator._holding is False
 
-    @pytest.mark.asyncio
     async def test_ptt_no_duplicate_press(self):
         """Holding SPACE should not emit multiple LISTENING_START events."""
         activator = PTTActivator()
@@ -150,123 +147,106 @@ class TestPTTActivator:
 # ── TestWakeWordActivator ────────────────────────────────────────────────────
 
 
-class TestWakeWordActivator:
-    """Wake-word mode: ML-based keyword spotting via openwakeword."""
+def _make_mock_oww_model(scores: list[float]) -> MagicMock:
+    """
+    Create a mock openwakeword model.
 
-    def _make_mock_oww(self, scores: list[float]):
-        """
-        Create a mock openwakeword module and model.
+    Args:
+        scores: List of prediction scores to return sequentially, one per
+                100 ms chunk.  A predict() call on a batch of chunks consumes
+                one score per chunk and returns the peak, as openwakeword does.
+    """
+    score_iter = iter(scores)
 
-        Args:
-            scores: List of prediction scores to return sequentially.
-                    Each call to model.predict() returns the next score.
-        """
-        score_iter = iter(scores)
+    def _predict(audio: np.ndarray) -> dict:
+        n_chunks = max(1, len(audio) // _CHUNK_SAMPLES)
+        return {"hey_jarvis_v0.1": max(next(score_iter, 0.0) for _ in range(n_chunks))}
 
-        mock_model = MagicMock()
-        mock_model.predict = MagicMock(
-            side_effect=lambda audio: {"hey_jarvis_v0.1": next(score_iter, 0.0)}
-        )
-        mock_model.reset = MagicMock()
+    mock_model = MagicMock()
+    mock_model.predict = MagicMock(side_effect=_predict)
+    mock_model.reset = MagicMock()
+    return mock_model
 
-        mock_oww_module = MagicMock()
-        mock_oww_module.utils.download_models = MagicMock()
 
-        mock_model_class = MagicMock(return_value=mock_model)
+@pytest_asyncio.fixture
+async def wake_activator():
+    """
+    Factory for WakeWordActivators with a mocked model and a running monitor task.
 
-        return mock_oww_module, mock_model_class, mock_model
-
-    @pytest.mark.asyncio
-    async def test_wake_word_detection_triggers_listening_start(self):
-        """When openwakeword returns score >= threshold, LISTENING_START fires."""
-        mock_oww, mock_model_cls, mock_model = self._make_mock_oww([0.0, 0.0, 0.85])
+    Call ``wake_activator(scores, **attrs)`` to get ``(activator, mock_model)``;
+    *attrs* are set on the activator before the monitor task starts.  Every
+    monitor task is cancelled and awaited on teardown.
+    """
+    tasks: list[asyncio.Task] = []
 
+    def _start(scores: list[float], **attrs) -> tuple[WakeWordActivator, MagicMock]:
+        mock_model = _make_mock_oww_model(scores)
         activator = WakeWordActivator()
         activator._threshold = 0.5
+        for name, value in attrs.items():
+            setattr(activator, name, value)
+        activator._oww_model = mock_model
+        activator._model_key = "hey_jarvis_v0.1"
+        activator._monitor_task = asyncio.create_task(activator._monitor_loop())
+        tasks.append(activator._monitor_task)
+        return activator, mock_model
 
-        with patch.dict(sys.modules, {
-            "openwakeword": mock_oww,
-            "openwakeword.model": MagicMock(Model=mock_model_cls),
-            "openwakeword.utils": mock_oww.utils,
-        }):
-            activator._oww_model = mock_model
-            activator._model_key = "hey_jarvis_v0.1"
-            activator._monitor_task = asyncio.create_task(activator._monitor_loop())
-
-            # Feed 3 chunks: 2 below threshold, 1 above
-            silence = _make_pcm_silence()
-            activator.push_audio(silence)
-            activator.push_audio(silence)
-            activator.push_audio(_make_pcm_tone())
+    yield _start
 
-            # Wait for processing
-            await asyncio.sleep(0.15)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
 
-            event = activator._events.get_nowait()
-            assert event == ActivationEvent.LISTENING_START
-            mock_model.reset.assert_called_once()
 
-            activator._monitor_task.cancel()
-            try:
-                await activator._monitor_task
-            except asyncio.CancelledError:
-                pass
+class TestWakeWordActivator:
+    """Wake-word mode: ML-based keyword spotting via openwakeword."""
 
-    @pytest.mark.asyncio
-    async def test_silence_after_wake_triggers_listening_end(self):
-        """After wake-word triggers, sustained silence should emit LISTENING_END."""
-        # First chunk triggers wake, then 15+ chunks of silence for turn end
-        scores = [0.9] + [0.0] * 20
-        mock_oww, mock_model_cls, mock_model = self._make_mock_oww(scores)
+    async def test_wake_word_detection_triggers_listening_start(self, wake_activator):
+        """When openwakeword returns score >= threshold, LISTENING_START fires."""
+        activator, mock_model = wake_activator([0.0, 0.0, 0.85])
 
-        activator = WakeWordActivator()
-        activator._threshold = 0.5
-        activator.SILENCE_FRAMES_TO_END = 5  # reduce for faster test
-        activator.ENERGY_THRESHOLD = 0.02
+        # Feed 3 chunks: 2 below threshold, 1 above
+        silence = _make_pcm_silence()
+        activator.push_audio(silence)
+        activator.push_audio(silence)
+        activator.push_audio(_make_pcm_tone())
 
-        activator._oww_model = mock_model
-        activator._model_key = "hey_jarvis_v0.1"
-        activator._monitor_task = asyncio.create_task(activator._monitor_loop())
+        event = await _await_event(activator)
+        assert event == ActivationEvent.LISTENING_START
+        mock_model.reset.assert_called_once()
+
+    async def test_silence_after_wake_triggers_listening_end(self, wake_activator):
+        """After wake-word triggers, sustained silence should emit LISTENING_END."""
+        # First chunk triggers wake, then 15+ chunks of silence for turn end
+        activator, _ = wake_activator(
+            [0.9] + [0.0] * 20,
+            SILENCE_FRAMES_TO_END=5,  # reduce for faster test
+            ENERGY_THRESHOLD=0.02,
+        )
 
         # First chunk: wake-word detected
         activator.push_audio(_make_pcm_tone())
-        await asyncio.sleep(0.05)
-        event = activator._events.get_nowait()
+        event = await _await_event(activator)
         assert event == ActivationEvent.LISTENING_START
 
         # Feed 6 silence chunks (> SILENCE_FRAMES_TO_END=5)
         for _ in range(6):
             activator.push_audio(_make_pcm_silence())
-        await asyncio.sleep(0.15)
 
-        event = activator._events.get_nowait()
+        event = await _await_event(activator)
         assert event == ActivationEvent.LISTENING_END
 
-        activator._monitor_task.cancel()
-        try:
-            await activator._monitor_task
-        except asyncio.CancelledError:
-            pass
-
-    @pytest.mark.asyncio
-    async def test_speech_during_turn_resets_silence_streak(self):
+    async def test_speech_during_turn_resets_silence_streak(self, wake_activator):
         """Speech during an active turn should reset the silence counter."""
-        scores = [0.9] + [0.0] * 20
-        mock_oww, mock_model_cls, mock_model = self._make_mock_oww(scores)
-
-        activator = WakeWordActivator()
-        activator._threshold = 0.5
-        activator.SILENCE_FRAMES_TO_END = 5
-        activator.ENERGY_THRESHOLD = 0.02
-
-        activator._oww_model = mock_model
-        activator._model_key = "hey_jarvis_v0.1"
-        activator._monitor_task = asyncio.create_task(activator._monitor_loop())
+        activator, _ = wake_activator(
+            [0.9] + [0.0] * 20,
+            SILENCE_FRAMES_TO_END=5,
+            ENERGY_THRESHOLD=0.02,
+        )
 
         # Trigger wake
         activator.push_audio(_make_pcm_tone())
-        await asyncio.sleep(0.05)
-        _ = activator._events.get_nowait()  # drain LISTENING_START
+        _ = await _await_event(activator)  # drain LISTENING_START
 
         # Feed 3 silence, then 1 loud, then 3 more silence — should NOT trigger end
         for _ in range(3):
@@ -274,74 +254,66 @@ class TestWakeWordActivator:
         activator.push_audio(_make_pcm_tone(amplitude=0.5))
         for _ in range(3):
             activator.push_audio(_make_pcm_silence())
-        await asyncio.sleep(0.15)
 
         # No LISTENING_END should have fired (silence streak never reached 5)
-        assert activator._events.empty()
-
-        activator._monitor_task.cancel()
-        try:
-            await activator._monitor_task
-        except asyncio.CancelledError:
-            pass
+        with pytest.raises(asyncio.TimeoutError):
+            await _await_event(activator, timeout=0.03)
 
-    @pytest.mark.asyncio
-    async def test_below_threshold_does_not_trigger(self):
+    async def test_below_threshold_does_not_trigger(self, wake_activator):
         """Scores below threshold should not trigger wake-word."""
-        mock_oww, mock_model_cls, mock_model = self._make_mock_oww([0.1, 0.2, 0.3, 0.4])
-
-        activator = WakeWordActivator()
-        activator._threshold = 0.5
-        activator._oww_model = mock_model
-        activator._model_key = "hey_jarvis_v0.1"
-        activator._monitor_task = asyncio.create_task(activator._monitor_loop())
+        activator, _ = wake_activator([0.1, 0.2, 0.3, 0.4])
 
         for _ in range(4):
             activator.push_audio(_make_pcm_tone())
-        await asyncio.sleep(0.15)
 
-        assert activator._events.empty()
+        with pytest.raises(asyncio.TimeoutError):
+            await _await_event(activator, timeout=0.03)
         assert activator._listening_for_wake is True
 
-        activator._monitor_task.cancel()
-        try:
-            await activator._monitor_task
-        except asyncio.CancelledError:
-            pass
-
-    @pytest.mark.asyncio
     async def test_push_audio_accepts_bytes(self):
         """push_audio should accept raw PCM bytes without error."""
         activator = WakeWordActivator()
         pcm = _make_pcm_silence()
         activator.push_audio(pcm)
-        assert not activator._audio_queue.empty()
-        chunk = activator._audio_queue.get_nowait()
+        assert len(activator._audio_ring) == 1
+        chunk = activator._audio_ring.popleft()
         assert chunk == pcm
 
-    @pytest.mark.asyncio
-    async def test_model_reset_called_on_detection(self):
+    async def test_model_reset_called_on_detection(self, wake_activator):
         """Model should be reset after wake-word detection to prevent re-triggering."""
-        mock_oww, mock_model_cls, mock_model = self._make_mock_oww([0.9])
-
-        activator = WakeWordActivator()
-        activator._threshold = 0.5
-        activator._oww_model = mock_model
-        activator._model_key = "hey_jarvis_v0.1"
-        activator._monitor_task = asyncio.create_task(activator._monitor_loop())
+        activator, mock_model = wake_activator([0.9])
 
         activator.push_audio(_make_pcm_tone())
-        await asyncio.sleep(0.1)
+        await _await_event(activator)
 
         mock_model.reset.assert_called_once()
 
-        activator._monitor_task.cancel()
-        try:
-            await activator._monitor_task
-        except asyncio.CancelledError:
-            pass
+    async def test_backlog_is_scored_in_one_predict_call(self, wake_activator):
+        """Chunks queued while the monitor is busy share a single predict() call."""
+        activator, mock_model = wake_activator([0.1, 0.2, 0.9])
+
+        for _ in range(3):
+            activator.push_audio(_make_pcm_tone())
+
+        event = await _await_event(activator)
+        assert event == ActivationEvent.LISTENING_START
+        mock_model.predict.assert_called_once()
+        assert len(mock_model.predict.call_args.args[0]) == 3 * _CHUNK_SAMPLES
+
+    async def test_audio_after_a_batched_wake_reaches_the_turn(self, wake_activator):
+        """Chunks batched behind the wake-word hit are not dropped from the new turn."""
+        activator, mock_model = wake_activator([0.9], SILENCE_FRAMES_TO_END=3)
+
+        # The wake word is in the first chunk; the three quiet chunks queued
+        # behind it in the same batch are enough on their own to end the turn.
+        activator.push_audio(_make_pcm_tone())
+        for _ in range(3):
+            activator.push_audio(_make_pcm_silence())
+
+        assert await _await_event(activator) == ActivationEvent.LISTENING_START
+        assert await _await_event(activator) == ActivationEvent.LISTENING_END
+        mock_model.predict.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_load_model_missing_oww_raises(self):
         """If openwakeword is not installed, _load_model should raise ImportError."""
         activator = WakeWordActivator()
@@ -369,62 +341,40 @@ class TestWakeWordActivator:
             activator = WakeWordActivator()
             assert activator._custom_model_path == "/tmp/hey_archon.onnx"
 
-    @pytest.mark.asyncio
-    async def test_stop_cancels_monitor_task(self):
+    async def test_stop_cancels_monitor_task(self, wake_activator):
         """stop() should cleanly cancel the monitor task."""
-        mock_oww, mock_model_cls, mock_model = self._make_mock_oww([])
-
-        activator = WakeWordActivator()
-        activator._oww_model = mock_model
-        activator._model_key = "hey_jarvis_v0.1"
-        activator._monitor_task = asyncio.create_task(activator._monitor_loop())
+        activator, _ = wake_activator([])
 
-        await asyncio.sleep(0.05)
+        await asyncio.sleep(0)  # let the monitor task start and block on its queue
         await activator.stop()
         assert activator._monitor_task.cancelled() or activator._monitor_task.done()
 
-    @pytest.mark.asyncio
-    async def test_wake_then_silence_then_wake_again(self):
+    async def test_wake_then_silence_then_wake_again(self, wake_activator):
         """Full cycle: wake → turn → silence → back to listening → wake again."""
         # Only predict() calls matter — silence chunks use RMS, not predict.
         # Two predict calls: first wake (0.9) and second wake (0.9).
-        scores = [0.9, 0.9]
-        mock_oww, mock_model_cls, mock_model = self._make_mock_oww(scores)
-
-        activator = WakeWordActivator()
-        activator._threshold = 0.5
-        activator.SILENCE_FRAMES_TO_END = 3  # fast for testing
-        activator.ENERGY_THRESHOLD = 0.02
-
-        activator._oww_model = mock_model
-        activator._model_key = "hey_jarvis_v0.1"
-        activator._monitor_task = asyncio.create_task(activator._monitor_loop())
+        activator, _ = wake_activator(
+            [0.9, 0.9],
+            SILENCE_FRAMES_TO_END=3,  # fast for testing
+            ENERGY_THRESHOLD=0.02,
+        )
 
         # First wake
         activator.push_audio(_make_pcm_tone())
-        await asyncio.sleep(0.05)
-        event1 = activator._events.get_nowait()
+        event1 = await _await_event(activator)
         assert event1 == ActivationEvent.LISTENING_START
 
         # Silence to end turn (4 chunks > SILENCE_FRAMES_TO_END=3)
         for _ in range(4):
             activator.push_audio(_make_pcm_silence())
-        await asyncio.sleep(0.1)
-        event2 = activator._events.get_nowait()
+        event2 = await _await_event(activator)
         assert event2 == ActivationEvent.LISTENING_END
 
         # Second wake
         activator.push_audio(_make_pcm_tone())
-        await asyncio.sleep(0.1)
-        event3 = activator._events.get_nowait()
+        event3 = await _await_event(activator)
         assert event3 == ActivationEvent.LISTENING_START
 
-        activator._monitor_task.cancel()
-        try:
-            await activator._monitor_task
-        except asyncio.CancelledError:
-            pass
-
 
 # ── TestBuildActivator ────────────────────────────────────────────────────────
 
@@ -451,14 +401,12 @@ class TestBuildActivator:
 class TestBaseActivator:
     """Base activator interface tests."""
 
-    @pytest.mark.asyncio
     async def test_emit_puts_event_in_queue(self):
         activator = VADActivator()  # concrete subclass
         activator._emit(ActivationEvent.EXIT)
         event = activator._events.get_nowait()
         assert event == ActivationEvent.EXIT
 
-    @pytest.mark.asyncio
     async def test_next_event_blocks_until_available(self):
         activator = VADActivator()
 
@@ -470,7 +418,6 @@ class TestBaseActivator:
         event = await asyncio.wait_for(activator.next_event(), timeout=1.0)
         assert event == ActivationEvent.LISTENING_START
 
-    @pytest.mark.asyncio
     async def test_stop_is_noop_by_default(self):
         activator = VADActivator()
         await activator.stop()  # should not raise
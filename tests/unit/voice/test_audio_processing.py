@@ -11,39 +11,30 @@ import numpy as np
 import pytest
 
 from archon.voice.audio_processing import AudioPreprocessor
+from tests.unit.voice.pcm_helpers import pcm_const, sine_pcm
 
 
 # ── Helpers ──────────────────────────────────────────────────────────────────
 
 
-def _sine_pcm(freq_hz: float, duration_s: float = 0.1, sample_rate: int = 16_000) -> bytes:
-    """Generate PCM bytes for a pure sine wave at the given frequency."""
-    n_samples = int(sample_rate * duration_s)
-    t = np.arange(n_samples, dtype=np.float64) / sample_rate
-    wave = np.sin(2.0 * math.pi * freq_hz * t)
-    pcm_int16 = (wave * 32767).astype(np.int16)
-    return pcm_int16.tobytes()
-
-
 def _silence_pcm(duration_s: float = 0.1, sample_rate: int = 16_000) -> bytes:
     """Generate PCM bytes of digital silence (all zeros)."""
-    n_samples = int(sample_rate * duration_s)
-    return np.zeros(n_samples, dtype=np.int16).tobytes()
+    return pcm_const(0, int(sample_rate * duration_s))
 
 
 def _constant_pcm(amplitude: float = 0.5, duration_s: float = 0.1, sample_rate: int = 16_000) -> bytes:
     """Generate PCM bytes of a DC signal (constant value)."""
-    n_samples = int(sample_rate * duration_s)
-    arr = np.full(n_samples, int(amplitude * 32767), dtype=np.int16)
-    return arr.tobytes()
+    return pcm_const(int(amplitude * 32767), int(sample_rate * duration_s))
 
 
 def _rms_of_pcm(pcm_bytes: bytes) -> float:
     """Compute RMS of PCM bytes in [0, 1] range."""
-    samples = np.frombuffer(pcm_bytes, dtype=np.int16).astype(np.float32)
+    samples = np.frombuffer(pcm_bytes, dtype=np.int16)
     if samples.size == 0:
         return 0.0
-    return float(np.sqrt(np.mean(samples**2))) / 32768.0
+    # Exact int64 sum of squares straight off the int16 samples
+    sumsq = int(np.einsum("i,i->", samples, samples, dtype=np.int64))
+    return math.sqrt(sumsq / samples.size) / 32768.0
 
 
 # ── High-pass filter tests ───────────────────────────────────────────────────
@@ -55,7 +46,7 @@ class TestHighPassFilter:
     def test_40hz_is_attenuated(self):
         """A 40 Hz tone (below 80 Hz cutoff) should be significantly reduced."""
         proc = AudioPreprocessor(sample_rate=16_000)
-        pcm_40hz = _sine_pcm(40.0)
+        pcm_40hz = sine_pcm(40.0)
         # Process multiple chunks to let filter state stabilise
         for _ in range(5):
             result = proc.process(pcm_40hz)
@@ -77,7 +68,7 @@ class TestHighPassFilter:
         """A 1 kHz tone (well above cutoff) should pass through largely unchanged."""
         proc = AudioPreprocessor(sample_rate=16_000)
         from archon.voice.audio_io import pcm_bytes_to_np
-        audio = pcm_bytes_to_np(_sine_pcm(1000.0))
+        audio = pcm_bytes_to_np(sine_pcm(1000.0))
         # Let filter stabilise
         for _ in range(3):
             filtered = proc._apply_highpass(audio)
@@ -90,12 +81,12 @@ class TestHighPassFilter:
         """Filter state should carry across calls (no discontinuity)."""
         proc = AudioPreprocessor(sample_rate=16_000)
         from archon.voice.audio_io import pcm_bytes_to_np
-        audio = pcm_bytes_to_np(_sine_pcm(1000.0, duration_s=0.05))
+        audio = pcm_bytes_to_np(sine_pcm(1000.0, duration_s=0.05))
         # First call sets initial state
-        out1 = proc._apply_highpass(audio.copy())
+        out1 = proc._apply_highpass(audio)
         z1_after_first = proc._hpf_z1
         # Second call should start from that state
-        out2 = proc._apply_highpass(audio.copy())
+        out2 = proc._apply_highpass(audio)
         z1_after_second = proc._hpf_z1
         # States should differ (they advanced)
         assert z1_after_first != z1_after_second
@@ -121,7 +112,7 @@ class TestNoiseGate:
         """Audio above threshold should pass unchanged."""
         proc = AudioPreprocessor(sample_rate=16_000)
         from archon.voice.audio_io import pcm_bytes_to_np
-        loud = pcm_bytes_to_np(_sine_pcm(440.0))  # ~0.707 RMS
+        loud = pcm_bytes_to_np(sine_pcm(440.0))  # ~0.707 RMS
         result = proc._apply_noise_gate(loud)
         np.testing.assert_array_equal(result, loud)
 
@@ -145,11 +136,11 @@ class TestAGC:
         """Quiet input should be amplified toward AGC_TARGET_RMS."""
         proc = AudioPreprocessor(sample_rate=16_000)
         from archon.voice.audio_io import pcm_bytes_to_np
-        quiet = pcm_bytes_to_np(_sine_pcm(440.0, duration_s=0.1))
+        quiet = pcm_bytes_to_np(sine_pcm(440.0, duration_s=0.1))
         quiet = quiet * 0.01  # Very quiet
         # Process several chunks to let gain stabilise
         for _ in range(10):
-            result = proc._apply_agc(quiet.copy())
+            result = proc._apply_agc(quiet)
         result_rms = float(np.sqrt(np.mean(result**2)))
         quiet_rms = float(np.sqrt(np.mean(quiet**2)))
         assert result_rms > quiet_rms * 2  # Should be significantly amplified
@@ -160,7 +151,7 @@ class TestAGC:
         loud = np.full(1600, 0.9, dtype=np.float32)
         # Process several chunks to let gain stabilise
         for _ in range(10):
-            result = proc._apply_agc(loud.copy())
+            result = proc._apply_agc(loud)
         result_rms = float(np.sqrt(np.mean(result**2)))
         # Should be compressed toward target (0.15)
         assert result_rms < 0.9
@@ -172,14 +163,25 @@ class TestAGC:
         loud = np.full(1600, 0.5, dtype=np.float32)
         # Process quiet to drive gain up
         for _ in range(5):
-            proc._apply_agc(quiet.copy())
+            proc._apply_agc(quiet)
         gain_after_quiet = proc._agc_gain
         # Now feed loud — gain should decrease but not instantly
-        proc._apply_agc(loud.copy())
+        proc._apply_agc(loud)
         gain_after_one_loud = proc._agc_gain
         # Gain should still be high (smoothing prevents instant drop)
         assert gain_after_one_loud > proc.AGC_TARGET_RMS / 0.5
 
+    def test_out_param_controls_mutation(self):
+        """Without out= the input is left alone; out=audio scales in place."""
+        proc = AudioPreprocessor(sample_rate=16_000)
+        quiet = np.full(1600, 0.01, dtype=np.float32)
+        result = proc._apply_agc(quiet)
+        assert result is not quiet
+        assert np.all(quiet == np.float32(0.01))
+        result = proc._apply_agc(quiet, out=quiet)
+        assert result is quiet
+        assert np.all(quiet > np.float32(0.01))
+
     def test_output_is_clipped(self):
         """Output should never exceed [-1.0, 1.0]."""
         proc = AudioPreprocessor(sample_rate=16_000)
@@ -207,14 +209,14 @@ class TestPreprocessorPipeline:
     def test_output_same_length_as_input(self):
         """Processed output should be exactly the same byte length."""
         proc = AudioPreprocessor(sample_rate=16_000)
-        pcm = _sine_pcm(440.0)
+        pcm = sine_pcm(440.0)
         result = proc.process(pcm)
         assert len(result) == len(pcm)
 
     def test_output_is_valid_pcm(self):
         """Processed output should be valid int16 PCM."""
         proc = AudioPreprocessor(sample_rate=16_000)
-        pcm = _sine_pcm(440.0)
+        pcm = sine_pcm(440.0)
         result = proc.process(pcm)
         # Should be parseable as int16
         arr = np.frombuffer(result, dtype=np.int16)
@@ -229,6 +231,19 @@ class TestPreprocessorPipeline:
         rms = _rms_of_pcm(result)
         assert rms < 0.001
 
+    def test_silence_after_speech_settles_to_passthrough(self):
+        """Once the filter rings down, digital silence skips the pipeline."""
+        proc = AudioPreprocessor(sample_rate=16_000)
+        proc.process(sine_pcm(440.0))
+        silence = _silence_pcm()
+        for _ in range(20):  # ring-down: still filtered, AGC may still move
+            result = proc.process(silence)
+        assert result == silence
+        assert proc._hpf_z1 == 0.0 and proc._hpf_z2 == 0.0
+        gain = proc._agc_gain
+        proc.process(silence)
+        assert proc._agc_gain == gain  # settled silence leaves the AGC alone
+
     def test_short_input_passthrough(self):
         """Input shorter than 2 bytes should pass through unchanged."""
         proc = AudioPreprocessor(sample_rate=16_000)
@@ -238,7 +253,7 @@ class TestPreprocessorPipeline:
     def test_no_clipping_on_normal_speech(self):
         """Normal-volume speech should not clip after processing."""
         proc = AudioPreprocessor(sample_rate=16_000)
-        pcm = _sine_pcm(440.0)
+        pcm = sine_pcm(440.0)
         # Run a few chunks to stabilise
         for _ in range(5):
             result = proc.process(pcm)
@@ -249,7 +264,7 @@ class TestPreprocessorPipeline:
     def test_sequential_chunks_are_continuous(self):
         """After AGC stabilises, sequential chunks should be smooth (no pops)."""
         proc = AudioPreprocessor(sample_rate=16_000)
-        pcm = _sine_pcm(440.0)
+        pcm = sine_pcm(440.0)
         results = []
         for _ in range(15):
             results.append(proc.process(pcm))
@@ -263,6 +278,21 @@ class TestPreprocessorPipeline:
             # sample-to-sample jumps of ~5400 at peak, so we need headroom.
             assert delta < 6554, f"Discontinuity at chunk boundary {i}: delta={delta}"
 
+    def test_fused_kernel_matches_staged_pipeline(self):
+        """The fused HPF/gate/AGC kernel should track the staged methods."""
+        from archon.voice.audio_processing import _hpf_gate_agc
+
+        staged = AudioPreprocessor(sample_rate=16_000)
+        staged._fused = None
+        fused = AudioPreprocessor(sample_rate=16_000)
+        fused._fused = _hpf_gate_agc  # uncompiled: same code path numba runs
+        for pcm in (sine_pcm(440.0), _silence_pcm(), sine_pcm(40.0), _constant_pcm(0.001)):
+            a = np.frombuffer(staged.process(pcm), dtype=np.int16).astype(np.int32)
+            b = np.frombuffer(fused.process(pcm), dtype=np.int16).astype(np.int32)
+            # float64 energy accumulation may move a sample by one LSB
+            assert np.max(np.abs(a - b)) <= 1
+        assert fused._agc_gain == pytest.approx(staged._agc_gain)
+
 
 # ── Spectral denoise fallback ────────────────────────────────────────────────
 
@@ -289,9 +319,32 @@ class TestSpectralDenoiseFallback:
         monkeypatch.setattr(builtins, "__import__", mock_import)
 
         from archon.voice.audio_io import pcm_bytes_to_np
-        audio = pcm_bytes_to_np(_sine_pcm(440.0))
+        audio = pcm_bytes_to_np(sine_pcm(440.0))
         result = proc._apply_spectral_denoise(audio)
         # Should return input unchanged
         np.testing.assert_array_equal(result, audio)
         # Flag should be auto-disabled
         assert proc._enable_spectral is False
+
+    def test_failed_import_is_not_retried(self, monkeypatch):
+        """After noisereduce fails to import once, later calls skip the import."""
+        import builtins
+
+        real_import = builtins.__import__
+        attempts = []
+
+        def mock_import(name, *args, **kwargs):
+            if name == "noisereduce":
+                attempts.append(name)
+                raise ImportError("mocked")
+            return real_import(name, *args, **kwargs)
+
+        proc = AudioPreprocessor(sample_rate=16_000, enable_spectral_denoise=True)
+        monkeypatch.setattr(builtins, "__import__", mock_import)
+
+        from archon.voice.audio_io import pcm_bytes_to_np
+        audio = pcm_bytes_to_np(sine_pcm(440.0))
+        for _ in range(3):
+            result = proc._apply_spectral_denoise(audio)
+        np.testing.assert_array_equal(result, audio)
+        assert attempts == ["noisereduce"]
@@ -0,0 +1,55 @@
+"""
+Unit tests for voice/gemini_live_client.py LiveSession sending.
+
+Uses a fake raw session — no API key or network required.
+"""
+
+import pytest
+
+pytest.importorskip("google.genai")
+
+from archon.voice.gemini_live_client import LiveSession
+
+
+class _FakeRawSession:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, input=None, **_):
+        self.sent.append(input)
+
+
+def _sent_pcm(raw: _FakeRawSession) -> list[bytes]:
+    return [msg.audio.data for msg in raw.sent]
+
+
+@pytest.fixture
+def session():
+    raw = _FakeRawSession()
+    return LiveSession(raw), raw
+
+
+async def test_batch_goes_out_as_one_message(session):
+    sess, raw = session
+    chunks = [bytes([i]) * 3200 for i in range(3)]
+    await sess.send_audio_batch(chunks)
+    assert _sent_pcm(raw) == [b"".join(chunks)]
+
+
+async def test_staging_buffer_is_reused_without_stale_bytes(session):
+    sess, raw = session
+    await sess.send_audio_batch([b"\x01" * 8, b"\x02" * 8, b"\x03" * 8])
+    buf = sess._send_buf
+    await sess.send_audio_batch([b"\x04" * 4, b"\x05" * 4])
+    assert sess._send_buf is buf
+    assert _sent_pcm(raw)[-1] == b"\x04" * 4 + b"\x05" * 4
+
+
+async def test_single_chunk_and_interrupt(session):
+    sess, raw = session
+    await sess.send_audio_batch([b"\x07" * 6])
+    assert _sent_pcm(raw) == [b"\x07" * 6]
+    sess.interrupt()
+    await sess.send_audio_batch([b"\x08" * 6, b"\x09" * 6])
+    await sess.send_audio(b"\x0a" * 6)
+    assert len(raw.sent) == 1
@@ -5,6 +5,7 @@ No audio device or API key required — pure Python logic tests.
 """
 
 import pytest
+from archon.voice import response_formatter
 from archon.voice.response_formatter import (
     format_for_speech,
     _strip_bold_italic,
@@ -13,37 +14,48 @@ from archon.voice.response_formatter import (
     _expand_code_fences,
     _list_to_prose,
     _cap_sentences,
+    _scrub_bytes,
+    _scrub_inline_markup,
+    _strip_markdown_links,
     MAX_SENTENCES,
 )
 
+_SCRUB_CASES = [
+    "Run **pytest** tests with *coverage*.",
+    "***bold italic*** and _under_ and __dunder__",
+    "2 * 3 = 6 and a lone ** marker",
+    "****\n*open\nclose*",
+    "my_var and other_var",
+    "Use `asyncio.run()` here, `` empty, `unclosed",
+    "See [the docs](https://example.com) and [broken] (link) or [](x)",
+    "Ünïcödé **wörds** — `çode` ✓",
+]
 
-class TestStripBoldItalic:
-    def test_double_star_bold(self):
-        assert _strip_bold_italic("**hello world**") == "hello world"
-
-    def test_single_star_italic(self):
-        assert _strip_bold_italic("*hello*") == "hello"
 
-    def test_triple_star(self):
-        assert _strip_bold_italic("***bold italic***") == "bold italic"
+def _regex_inline(text: str) -> str:
+    return _strip_markdown_links(_strip_code_spans(_strip_bold_italic(text)))
 
-    def test_underscore_italic(self):
-        assert _strip_bold_italic("_hello_") == "hello"
 
-    def test_plain_text_unchanged(self):
-        assert _strip_bold_italic("plain text") == "plain text"
-
-    def test_mixed_content(self):
-        result = _strip_bold_italic("Run **pytest** tests with *coverage*.")
-        assert result == "Run pytest tests with coverage."
+class TestStripBoldItalic:
+    @pytest.mark.parametrize(
+        "inp,expected",
+        [
+            ("**hello world**", "hello world"),
+            ("*hello*", "hello"),
+            ("***bold italic***", "bold italic"),
+            ("_hello_", "hello"),
+            ("plain text", "plain text"),
+            ("Run **pytest** tests with *coverage*.", "Run pytest tests with coverage."),
+        ],
+    )
+    def test_strip(self, inp, expected):
+        assert _strip_bold_italic(inp) == expected
 
 
 class TestStripHeaders:
-    def test_h1(self):
-        assert _strip_headers("# Title") == "Title"
-
-    def test_h3(self):
-        assert _strip_headers("### Section") == "Section"
+    @pytest.mark.parametrize("inp,expected", [("# Title", "Title"), ("### Section", "Section")])
+    def test_strip(self, inp, expected):
+        assert _strip_headers(inp) == expected
 
     def test_multiline(self):
         text = "# First\nSome text\n## Second"
@@ -54,12 +66,15 @@ class TestStripHeaders:
 
 
 class TestStripCodeSpans:
-    def test_inline_code(self):
-        assert _strip_code_spans("Use `asyncio.run()` here") == "Use asyncio.run() here"
-
-    def test_multiple_spans(self):
-        result = _strip_code_spans("`foo` and `bar`")
-        assert result == "foo and bar"
+    @pytest.mark.parametrize(
+        "inp,expected",
+        [
+            ("Use `asyncio.run()` here", "Use asyncio.run() here"),
+            ("`foo` and `bar`", "foo and bar"),
+        ],
+    )
+    def test_strip(self, inp, expected):
+        assert _strip_code_spans(inp) == expected
 
 
 class TestExpandCodeFences:
@@ -98,9 +113,15 @@ class TestListToProse:
         result = _list_to_prose(text)
         assert "only thing" in result
 
-    def test_plain_text_unchanged(self):
-        text = "No bullets here."
-        assert _list_to_prose(text) == text
+    @pytest.mark.parametrize(
+        "inp,expected",
+        [
+            ("No bullets here.", "No bullets here."),
+            ("Steps:\n12. build\n13. ship", "Steps: build and ship"),
+        ],
+    )
+    def test_exact(self, inp, expected):
+        assert _list_to_prose(inp) == expected
 
 
 class TestCapSentences:
@@ -121,6 +142,20 @@ class TestCapSentences:
         assert "What is it?" in result
 
 
+class TestScrubBytes:
+    """The byte scanner must match the regex passes it replaces."""
+
+    @pytest.mark.parametrize("text", _SCRUB_CASES)
+    def test_matches_regex_passes(self, text):
+        assert _scrub_inline_markup(text, _scrub_bytes) == _regex_inline(text)
+
+    @pytest.mark.parametrize("text", _SCRUB_CASES)
+    def test_compiled_kernel_matches_regex_passes(self, text):
+        pytest.importorskip("numba")
+        kernel = response_formatter._get_scrub_kernel()
+        assert _scrub_inline_markup(text, kernel) == _regex_inline(text)
+
+
 class TestFormatForSpeech:
     def test_strips_markdown_end_to_end(self):
         md = "## Database Design\n\nUse **SQLite** for local storage with `aiosqlite`."
@@ -150,3 +185,18 @@ class TestFormatForSpeech:
         text = "Here is a plain spoken answer. It has no markdown. Great."
         result = format_for_speech(text)
         assert "Here is a plain spoken answer" in result
+
+    def test_stray_markers_kept(self):
+        # Unpaired markers are not markup — the fast path must not drop them
+        assert format_for_speech("2 * 3 is six, see file_name.") == "2 * 3 is six, see file_name."
+
+    def test_repeated_short_chunk_hits_cache(self):
+        first = format_for_speech("Here's the **code**.")
+        second = format_for_speech("Here's the **code**.")
+        assert first == second == "Here's the code."
+        assert format_for_speech.cache_info().hits == 1
+
+    def test_long_text_bypasses_cache(self):
+        long_text = "word " * response_formatter._CACHE_MAX_CHARS
+        format_for_speech(long_text, full_detail=True)
+        assert format_for_speech.cache_info().currsize == 0
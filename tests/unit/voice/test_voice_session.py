@@ -0,0 +1,126 @@
+"""
+Unit tests for voice/voice_session.py helpers.
+
+No audio device or API key required.
+"""
+
+import asyncio
+import contextlib
+import io
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+from rich.console import Console
+
+from archon.voice import voice_session
+from archon.voice.audio_io import AudioOutputError
+from archon.voice.voice_session import VoiceSession, _register_stdin_reader
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="loop.add_reader needs a POSIX fd")
+
+
+@pytest.fixture
+def stdin_pipe(monkeypatch):
+    """Replace sys.stdin with the read end of a pipe; yields the write fd."""
+    r, w = os.pipe()
+    reader = open(r, "r")
+    monkeypatch.setattr(sys, "stdin", reader)
+    yield w
+    reader.close()
+    try:
+        os.close(w)
+    except OSError:
+        pass
+
+
+async def _drain(lines: "asyncio.Queue[str]") -> list[str]:
+    await asyncio.sleep(0.05)
+    return [lines.get_nowait() for _ in range(lines.qsize())]
+
+
+async def test_stdin_reader_splits_lines_and_carries_partials(stdin_pipe):
+    loop = asyncio.get_running_loop()
+    lines: asyncio.Queue[str] = asyncio.Queue()
+    unregister = _register_stdin_reader(loop, lines)
+    assert unregister is not None
+    try:
+        # Two whole lines in one read are both delivered; the partial waits
+        os.write(stdin_pipe, b"/voice\n/help\n/ex")
+        assert await _drain(lines) == ["/voice\n", "/help\n"]
+
+        os.write(stdin_pipe, b"it\n")
+        assert await _drain(lines) == ["/exit\n"]
+
+        os.close(stdin_pipe)
+        assert await _drain(lines) == [""]  # EOF
+    finally:
+        unregister()
+    assert os.get_blocking(sys.stdin.fileno())
+
+
+# ── run() error reporting ─────────────────────────────────────────────────────
+
+
+class _FakeDevice:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _FakeViz(_FakeDevice):
+    _state = None
+
+    def set_state(self, state):
+        self._state = state
+
+    def push_speaker_rms(self, rms):
+        pass
+
+
+class _SilentMic(_FakeDevice):
+    """A mic that never produces a frame."""
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        await asyncio.Event().wait()
+
+
+class _BrokenSpeaker(_FakeDevice):
+    async def play(self, pcm):
+        raise AudioOutputError("device unplugged")
+
+
+class _FakeSession:
+    interrupted = False
+
+    def clear_interrupt(self):
+        pass
+
+    async def receive(self):
+        yield SimpleNamespace(is_final=False, audio=b"\0\0" * 240, rms=0.0, text=None)
+
+
+class _FakeLiveClient:
+    @contextlib.asynccontextmanager
+    async def session(self):
+        yield _FakeSession()
+
+
+async def test_run_reports_speaker_error_raised_mid_session(stdin_pipe, monkeypatch, tmp_path):
+    out = io.StringIO()
+    monkeypatch.setattr(voice_session, "console", Console(file=out, width=200))
+    monkeypatch.setattr(voice_session, "WaveformVisualizer", _FakeViz)
+    monkeypatch.setattr(voice_session, "MicCapture", _SilentMic)
+    monkeypatch.setattr(voice_session, "SpeakerPlayback", _BrokenSpeaker)
+
+    session = VoiceSession(tmp_path, api_key="test", live_client=_FakeLiveClient())
+    await asyncio.wait_for(session.run(), timeout=5)
+
+    # The TaskGroup's ExceptionGroup is unwrapped, so run()'s handler matches
+    assert "Speaker Error: device unplugged" in out.getvalue()
@@ -8,6 +8,8 @@ Tests:
 """
 
 import asyncio
+import hashlib
+import pickle
 import shutil
 from pathlib import Path
 import sys
@@ -15,14 +17,42 @@ import sys
 # Ensure src is in path
 sys.path.append("src")
 
-from archon.manager.learning_engine import LearningEngine
 from archon.utils.schemas import Task, TaskResult, AgentType, TaskStatus
 from datetime import datetime
 
+# Embeddings of the fixed texts below, keyed by sha256 of the embedder's
+# identity and the text, so repeat runs skip the embedding model's forward
+# passes and a changed model never reuses stale vectors.
+_EMB_CACHE = Path(".archon_test_emb_cache.pkl")
+
+
+def _load_emb_cache() -> dict:
+    if _EMB_CACHE.exists():
+        try:
+            with _EMB_CACHE.open("rb") as f:
+                return pickle.load(f)
+        except Exception:
+            pass  # Corrupt or stale cache: rebuild it
+    return {}
+
+
+def _embeddings_for(engine: "LearningEngine", cache: dict, texts: list) -> list:
+    """Return embeddings for *texts*, embedding only the uncached ones (in one batch)."""
+    prefix = f"{engine.embedder_id}\0".encode()
+    keys = [hashlib.sha256(prefix + t.encode()).hexdigest() for t in texts]
+    missing = [(k, t) for k, t in zip(keys, texts) if k not in cache]
+    if missing:
+        vectors = engine.embed([t for _, t in missing])
+        cache.update(zip((k for k, _ in missing), vectors))
+    return [cache.get(k) for k in keys]
+
 
 async def verify():
     print("🧠 Verifying Phase 4: Learning Engine Upgrade...")
 
+    # Imported here so the banner appears before the (potentially slow) import
+    from archon.manager.learning_engine import LearningEngine
+
     # Setup test directory
     test_dir = Path("./.archon_test")
     if test_dir.exists():
@@ -41,6 +71,9 @@ async def verify():
     # 1. Record some history
     print("\n[1] Recording task history...")
 
+    emb_cache = _load_emb_cache()
+    cache_size = len(emb_cache)
+
     history_data = [
         ("Build a React login form", AgentType.FRONTEND, "gpt-4", True, 0.95),
         ("Implement JWT authentication API", AgentType.BACKEND, "gpt-4", True, 0.92),
@@ -49,6 +82,7 @@ async def verify():
         ("Write unit tests for auth service", AgentType.TESTING, "gpt-4", True, 0.90),
     ]
 
+    records = []
     for i, (desc, agent, model, success, score) in enumerate(history_data):
         task = Task(
             task_id=f"task_{i}", description=desc, agent_type=agent, status=TaskStatus.COMPLETED
@@ -60,15 +94,24 @@ async def verify():
             execution_time_ms=1000,
             model_used=model,
         )
-        await engine.record_outcome(task, result)
-        print(f"    - Recorded: {desc[:40]}...")
+        records.append((task, result))
+
+    query = "Create a sign in page"
+    *embeddings, query_embedding = _embeddings_for(
+        engine,
+        emb_cache,
+        [LearningEngine.context_summary(t, r) for t, r in records] + [query],
+    )
+
+    for (task, result), embedding in zip(records, embeddings):
+        await engine.record_outcome(task, result, precomputed_embedding=embedding)
+        print(f"    - Recorded: {task.description[:40]}...")
 
     # 2. Test Semantic Search
     print("\n[2] Testing Semantic Search...")
-    query = "Create a sign in page"
     print(f"    Query: '{query}'")
 
-    similar = await engine.get_similar_tasks(query, limit=2)
+    similar = await engine.get_similar_tasks(query, limit=2, query_embedding=query_embedding)
     if similar:
         for t in similar:
             print(f"    -> Found match: '{t['description']}' (model: {t['model_used']})")
@@ -95,6 +138,10 @@ async def verify():
     else:
         print(f"    ⚠️  Recommendation might vary: {rec_model}")
 
+    if len(emb_cache) != cache_size:
+        with _EMB_CACHE.open("wb") as f:
+            pickle.dump(emb_cache, f)
+
     # Cleanup
     if test_dir.exists():
         shutil.rmtree(test_dir)
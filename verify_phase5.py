@@ -32,13 +32,26 @@ async def verify():
     # 1. Initialize Components
     print("\n[1] Initializing Tool Ecosystem...")
     sandbox = ToolSandbox(str(test_dir))
-    eraser = EraserCLITool(sandbox)
+    # The eraser gets its own sandbox (and so its own persistent shell) so its
+    # validation can run alongside the 'ls' smoke test below
+    eraser = EraserCLITool(ToolSandbox(str(test_dir)))
 
     print(f"    - Sandbox root: {sandbox.sandbox_root}")
     print(f"    - Tool initialized: {eraser.name}")
 
+    # The eraser-cli check and the sandbox 'ls' smoke test run concurrently on
+    # separate shells.  Give them a moment to spawn and receive their commands,
+    # then build the manager (router) here on the loop thread while the
+    # subprocesses work.  Results are printed in the usual order.
+    probes = asyncio.gather(
+        eraser.validate(),
+        sandbox.exec_shell("ls", "ls -la", timeout_seconds=2),
+    )
+    await asyncio.wait([probes], timeout=0.05)
+    manager = ManagerOrchestrator(str(test_dir))
+
     # Check validation
-    is_valid = await eraser.validate()
+    is_valid, res = await probes
     if is_valid:
         print("    ✅ eraser-cli is installed and valid.")
     else:
@@ -51,8 +64,7 @@ async def verify():
     print("\n[2] Testing Router Selection...")
     # We mock Manager to test router isolation or just use Manager's router
     # Let's instantiate Manager briefly to see integration
-    # Manager constructor needs project_path
-    manager = ManagerOrchestrator(str(test_dir))
+    # Manager constructor needs project_path (built above)
 
     # Manually register for test consistency (Manager does it in init too)
     # manager.tool_router.register_tool(eraser)
@@ -94,19 +106,16 @@ async def verify():
 
     # 3. Simulate Execution
     print("\n[3] Simulating Tool Execution...")
+    # 'ls' ran alongside the validation above
     if is_valid:
-        # If installed, try meaningful execution?
-        # Maybe too complex for quick verify.
-        # Just creating a file and running 'ls'?
-        # Sandbox execution test.
-        res = await sandbox.execute("ls", "ls -la", timeout_seconds=2)
         print(f"    Sandbox 'ls' execution: {'Success' if res.success else 'Failed'}")
     else:
         # If eraser not installed, verify basic sandbox command works (ls)
-        res = await sandbox.execute("ls", "ls -la", timeout_seconds=2)
         print(f"    Sandbox basic check (ls): {'Success' if res.success else 'Failed'}")
 
     # Cleanup
+    await sandbox.close()
+    await eraser.sandbox.close()
     if test_dir.exists():
         shutil.rmtree(test_dir)
     print("\n✅ Phase 5 Verification Complete.")